@@ -5,6 +5,10 @@ Password hash generator for Unraid Monitor Web UI.
 This script generates a bcrypt password hash that can be used as the
 WEB_PASSWORD environment variable for secure Web UI authentication.
 
+Hashing goes straight through the `bcrypt` package (Rust implementation
+since 4.x) instead of passlib, so the cost-12 key schedule runs entirely
+in native code.
+
 Usage:
     python generate_password.py [password]
     
@@ -28,15 +32,19 @@ Example:
 
 import sys
 import getpass
-from passlib.context import CryptContext
 
-# Password hashing context (same as in Web UI)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
+
+# Work factor for bcrypt ($2b$12$...)
+BCRYPT_ROUNDS = 12
 
 
 def generate_hash(password: str) -> str:
     """Generate bcrypt hash for password."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8"),
+        bcrypt.gensalt(rounds=BCRYPT_ROUNDS),
+    ).decode("ascii")
 
 
 def main():
@@ -10,22 +10,43 @@ Handles:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import logging
+import mmap
+import os
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Awaitable
+from typing import TYPE_CHECKING, Any, Callable, Awaitable
 
 from alerts.models import AlertLevel, AlertState, MetricReading
 
+# orjson is optional - fall back to the stdlib encoder if it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
-    from discord_client import DiscordClient
+    from notifications import DiscordProvider
     from config import AlertsConfig
 
 
 logger = logging.getLogger(__name__)
 
 
+# How often pending state changes are flushed to disk
+STATE_FLUSH_INTERVAL_SECONDS = 10
+
+
+def _format_duration(seconds: int) -> str:
+    """Format an alert duration as "Xh Ym" (or "Ym" under an hour)."""
+    hours, minutes = divmod(seconds // 60, 60)
+    return f"{hours}h {minutes}m" if hours else f"{minutes}m"
+
+
 class AlertManager:
     """
     Manages alert state, cooldowns, and notifications.
@@ -36,11 +57,12 @@ class AlertManager:
     - Recovery: Notify when metric returns to normal
     - Hysteresis: Prevent flapping by requiring value to drop below threshold-buffer
     - Persistence: Save state to disk to survive container restarts
+      (debounced - changes are flushed periodically and on shutdown)
     """
     
     def __init__(
         self,
-        discord_client: "DiscordClient",
+        discord_client: "DiscordProvider",
         config: "AlertsConfig",
         state_file: Path | str | None = None,
     ):
@@ -54,10 +76,28 @@ class AlertManager:
         """
         self.discord = discord_client
         self.config = config
+        self._cooldown_delta = timedelta(minutes=config.cooldown_minutes)
         
         # State storage
         self._states: dict[str, AlertState] = {}
         
+        # Inactive states loaded from disk, hydrated on first get_state()
+        self._raw_states: dict[str, dict[str, Any]] = {}
+        
+        # Serialized form of each state, rebuilt only for keys marked dirty
+        self._state_dicts: dict[str, dict[str, Any]] = {}
+        self._dirty_keys: set[str] = set()
+        
+        # Indexes over _states, kept in sync by _index_state()
+        self._active_keys: set[str] = set()
+        self._active_by_level: dict[AlertLevel, set[str]] = {level: set() for level in AlertLevel}
+        self._trigger_counts: dict[str, int] = {}
+        self._total_triggers = 0
+        
+        # Debounced persistence
+        self._dirty = False
+        self._flush_task: asyncio.Task | None = None
+        
         # Persistence - with fallback to /tmp if /app/data is not writable
         if state_file:
             self.state_file = Path(state_file)
@@ -69,6 +109,9 @@ class AlertManager:
         
         # Load existing state if available
         self._load_state()
+        
+        # Make sure pending changes survive an unclean exit
+        atexit.register(self.flush)
     
     def _ensure_writable_state_file(self) -> None:
         """Ensure we can write to the state file, fallback to /tmp if not."""
@@ -95,56 +138,172 @@ class AlertManager:
             return
         
         try:
-            with open(self.state_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_state_file()
             
             for key, state_data in data.items():
-                self._states[key] = AlertState.from_dict(state_data)
+                self._state_dicts[key] = state_data
+                
+                if state_data.get("is_active"):
+                    # Active alerts are needed right away for stats/cooldowns
+                    state = AlertState.from_dict(state_data)
+                    self._states[key] = state
+                    self._index_state(state)
+                else:
+                    self._raw_states[key] = state_data
+                    trigger_count = state_data.get("trigger_count", 0)
+                    self._trigger_counts[key] = trigger_count
+                    self._total_triggers += trigger_count
             
-            logger.info(f"Loaded {len(self._states)} alert states from disk")
+            logger.info(f"Loaded {len(data)} alert states from disk ({len(self._states)} active)")
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse alert state file: {e}")
         except Exception as e:
             logger.error(f"Failed to load alert state: {e}")
     
+    def _read_state_file(self) -> dict[str, Any]:
+        """Parse the state file straight from a read-only memory map."""
+        with open(self.state_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson is None:
+                    return json.loads(mm[:])
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    
     def _save_state(self) -> None:
-        """Save alert state to disk."""
+        """Save alert state to disk (atomically via a temp file)."""
         try:
             # Ensure directory exists
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
             
-            data = {
-                key: state.to_dict()
-                for key, state in self._states.items()
-            }
+            data = self._refresh_state_dicts()
+            
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+            else:
+                payload = json.dumps(data, indent=2, default=str).encode("utf-8")
             
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
+            with tempfile.NamedTemporaryFile(
+                "wb",
+                dir=self.state_file.parent,
+                prefix=".alert_state.",
+                delete=False,
+            ) as f:
+                try:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    # NamedTemporaryFile creates 0600; keep the usual data file mode
+                    os.chmod(f.name, 0o644)
+                except BaseException:
+                    f.close()
+                    os.unlink(f.name)
+                    raise
+            os.replace(f.name, self.state_file)
+            self._dirty = False
             
-            logger.debug(f"Saved {len(self._states)} alert states to disk")
+            logger.debug(f"Saved {len(data)} alert states to disk")
             
         except Exception as e:
             logger.error(f"Failed to save alert state: {e}")
     
+    def _refresh_state_dicts(self) -> dict[str, dict[str, Any]]:
+        """Re-serialize only the states that changed since the last refresh."""
+        for key in self._dirty_keys:
+            state = self._states.get(key)
+            if state is not None:
+                self._state_dicts[key] = state.to_dict()
+        self._dirty_keys.clear()
+        return self._state_dicts
+    
+    def _mark_dirty(self, alert_key: str) -> None:
+        """Mark a state as changed so the next save re-serializes it."""
+        self._dirty_keys.add(alert_key)
+        self._dirty = True
+    
+    def _schedule_flush(self) -> None:
+        """Make sure the background flush loop is running."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+        except RuntimeError:
+            # No event loop (e.g. called from sync code) - write immediately
+            self.flush()
+    
+    async def _flush_loop(self) -> None:
+        """Periodically write pending state changes to disk."""
+        while True:
+            await asyncio.sleep(STATE_FLUSH_INTERVAL_SECONDS)
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write alert state to disk if anything changed since the last save."""
+        if self._dirty:
+            self._save_state()
+    
+    async def close(self) -> None:
+        """Stop the background flush loop and persist pending changes."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        self.flush()
+        # Flushed here; nothing left for the exit hook to do
+        atexit.unregister(self.flush)
+    
+    def _index_state(self, state: AlertState) -> None:
+        """Update the active/level/trigger indexes after a state changed."""
+        key = state.alert_key
+        
+        for keys in self._active_by_level.values():
+            keys.discard(key)
+        if state.is_active:
+            self._active_keys.add(key)
+            self._active_by_level[state.level].add(key)
+        else:
+            self._active_keys.discard(key)
+        
+        self._total_triggers += state.trigger_count - self._trigger_counts.get(key, 0)
+        self._trigger_counts[key] = state.trigger_count
+    
+    def _get_or_create_state(self, alert_key: str) -> AlertState:
+        """Get the state for an alert key, creating it if missing."""
+        state = self.get_state(alert_key)
+        if state is None:
+            state = AlertState(alert_key=alert_key)
+            self._states[alert_key] = state
+            self._mark_dirty(alert_key)
+        return state
+    
     def get_state(self, alert_key: str) -> AlertState | None:
         """Get the current state for an alert key."""
-        return self._states.get(alert_key)
+        state = self._states.get(alert_key)
+        if state is None and alert_key in self._raw_states:
+            state = AlertState.from_dict(self._raw_states.pop(alert_key))
+            self._states[alert_key] = state
+        return state
     
     def get_active_alerts(self) -> list[AlertState]:
         """Get all currently active alerts."""
-        return [s for s in self._states.values() if s.is_active]
+        return [self._states[key] for key in self._active_keys]
     
     # =========================================================================
     # Cooldown logic
     # =========================================================================
     
-    def _is_in_cooldown(self, state: AlertState) -> bool:
+    def _is_in_cooldown(self, state: AlertState, now: datetime) -> bool:
         """
         Check if an alert is in cooldown period.
         
         Args:
             state: Alert state to check
+            now: Current time
         
         Returns:
             True if still in cooldown, False if can send alert
@@ -152,10 +311,7 @@ class AlertManager:
         if state.last_alert_sent is None:
             return False
         
-        cooldown = timedelta(minutes=self.config.cooldown_minutes)
-        time_since_last = datetime.now() - state.last_alert_sent
-        
-        return time_since_last < cooldown
+        return now - state.last_alert_sent < self._cooldown_delta
     
     def _should_escalate(self, state: AlertState, new_level: AlertLevel) -> bool:
         """
@@ -185,17 +341,51 @@ class AlertManager:
         Returns:
             True if an alert was sent
         """
-        alert_key = f"{reading.metric_type.value}_{reading.metric_id}"
+        alert_sent = await self._process_reading(reading, datetime.now())
+        
+        # Persist state (debounced)
+        self._schedule_flush()
+        
+        return alert_sent
+    
+    async def process_readings(self, readings: list[MetricReading]) -> list[bool]:
+        """
+        Process a batch of metric readings with a single state flush.
+        
+        Args:
+            readings: The metric readings to process
+        
+        Returns:
+            For each reading, True if an alert was sent (False if it failed)
+        """
+        now = datetime.now()
+        results = []
+        try:
+            for reading in readings:
+                # One failing reading must not drop the rest of the batch
+                try:
+                    results.append(await self._process_reading(reading, now))
+                except Exception as e:
+                    logger.error(f"Error processing reading {reading.alert_key}: {e}")
+                    results.append(False)
+        finally:
+            # Persist whatever state changes were applied
+            if readings:
+                self._schedule_flush()
+        
+        return results
+    
+    async def _process_reading(self, reading: MetricReading, now: datetime) -> bool:
+        """Update state for one reading and send alerts (without persisting)."""
+        alert_key = reading.alert_key
         current_level = reading.get_alert_level()
         
         # Get or create state
-        state = self._states.get(alert_key)
-        if state is None:
-            state = AlertState(alert_key=alert_key)
-            self._states[alert_key] = state
+        state = self._get_or_create_state(alert_key)
         
         # Update current value
         state.current_value = reading.value
+        self._mark_dirty(alert_key)
         
         alert_sent = False
         
@@ -205,6 +395,7 @@ class AlertManager:
                 state=state,
                 reading=reading,
                 level=current_level,
+                now=now,
             )
         else:
             # Value is below threshold - check for recovery
@@ -212,10 +403,10 @@ class AlertManager:
                 alert_sent = await self._handle_recovery(
                     state=state,
                     reading=reading,
+                    now=now,
                 )
         
-        # Persist state
-        self._save_state()
+        self._index_state(state)
         
         return alert_sent
     
@@ -224,11 +415,10 @@ class AlertManager:
         state: AlertState,
         reading: MetricReading,
         level: AlertLevel,
+        now: datetime,
     ) -> bool:
         """Handle a metric that has exceeded its threshold."""
         
-        now = datetime.now()
-        
         # Update state
         state.threshold_value = (
             reading.critical_threshold if level == AlertLevel.CRITICAL
@@ -249,7 +439,7 @@ class AlertManager:
             
             logger.info(f"New alert: {state.alert_key} at level {level.value}")
             
-            return await self._send_alert(state, reading, level)
+            return await self._send_alert(state, reading, level, now)
         
         elif is_escalation:
             # Escalating from warning to critical
@@ -259,18 +449,18 @@ class AlertManager:
             logger.info(f"Escalating alert: {state.alert_key} to {level.value}")
             
             return await self._send_alert(
-                state, reading, level,
+                state, reading, level, now,
                 title_prefix="Escalated: ",
             )
         
-        elif not self._is_in_cooldown(state):
+        elif not self._is_in_cooldown(state, now):
             # Repeat alert after cooldown
             state.trigger_count += 1
             
             logger.debug(f"Repeat alert: {state.alert_key} (count: {state.trigger_count})")
             
             return await self._send_alert(
-                state, reading, level,
+                state, reading, level, now,
                 include_duration=True,
             )
         
@@ -281,6 +471,7 @@ class AlertManager:
         self,
         state: AlertState,
         reading: MetricReading,
+        now: datetime,
     ) -> bool:
         """Handle recovery when metric returns to normal."""
         
@@ -298,13 +489,7 @@ class AlertManager:
             # Calculate how long the alert was active
             duration = ""
             if state.first_triggered:
-                delta = datetime.now() - state.first_triggered
-                hours, remainder = divmod(int(delta.total_seconds()), 3600)
-                minutes, _ = divmod(remainder, 60)
-                if hours > 0:
-                    duration = f"{hours}h {minutes}m"
-                else:
-                    duration = f"{minutes}m"
+                duration = _format_duration(int((now - state.first_triggered).total_seconds()))
             
             alert_sent = await self.discord.send_alert(
                 level="recovery",
@@ -314,7 +499,7 @@ class AlertManager:
                 threshold=f"< {state.threshold_value:.0f}{reading.unit}" if state.threshold_value else None,
                 extra_fields=[
                     {"name": "Duration", "value": duration, "inline": True},
-                    {"name": "Peak Level", "value": state.level.value.title() if state.level else "Unknown", "inline": True},
+                    {"name": "Peak Level", "value": state.level.title if state.level else "Unknown", "inline": True},
                 ] if duration else None,
             )
         
@@ -330,6 +515,7 @@ class AlertManager:
         state: AlertState,
         reading: MetricReading,
         level: AlertLevel,
+        now: datetime,
         title_prefix: str = "",
         include_duration: bool = False,
     ) -> bool:
@@ -338,32 +524,25 @@ class AlertManager:
         extra_fields = []
         
         if include_duration and state.first_triggered:
-            delta = datetime.now() - state.first_triggered
-            hours, remainder = divmod(int(delta.total_seconds()), 3600)
-            minutes, _ = divmod(remainder, 60)
-            if hours > 0:
-                duration = f"{hours}h {minutes}m"
-            else:
-                duration = f"{minutes}m"
+            duration = _format_duration(int((now - state.first_triggered).total_seconds()))
             extra_fields.append({"name": "Duration", "value": duration, "inline": True})
         
         if state.trigger_count > 1:
             extra_fields.append({"name": "Occurrences", "value": str(state.trigger_count), "inline": True})
         
         # Add any context from the reading
-        for key, value in reading.context.items():
-            extra_fields.append({"name": key, "value": str(value), "inline": True})
+        extra_fields.extend(reading.context_fields)
         
         success = await self.discord.send_alert(
             level=level.value,
-            title=f"{title_prefix}{reading.name} {level.value.title()}",
+            title=f"{title_prefix}{reading.name} {level.title}",
             current_value=f"{reading.value:.1f}{reading.unit}",
             threshold=f"{state.threshold_value:.0f}{reading.unit}" if state.threshold_value else None,
             extra_fields=extra_fields if extra_fields else None,
         )
         
         if success:
-            state.last_alert_sent = datetime.now()
+            state.last_alert_sent = now
         
         return success
     
@@ -394,13 +573,11 @@ class AlertManager:
         """
         alert_key = f"container_{container_name}_{issue_type}"
         
-        state = self._states.get(alert_key)
-        if state is None:
-            state = AlertState(alert_key=alert_key)
-            self._states[alert_key] = state
+        now = datetime.now()
+        state = self._get_or_create_state(alert_key)
         
         # Check cooldown
-        if state.is_active and self._is_in_cooldown(state):
+        if state.is_active and self._is_in_cooldown(state, now):
             return False
         
         # Send alert
@@ -412,7 +589,6 @@ class AlertManager:
         )
         
         if success:
-            now = datetime.now()
             if not state.is_active:
                 state.is_active = True
                 state.first_triggered = now
@@ -422,7 +598,9 @@ class AlertManager:
             
             state.level = level
             state.last_alert_sent = now
-            self._save_state()
+            self._index_state(state)
+            self._mark_dirty(alert_key)
+            self._schedule_flush()
         
         return success
     
@@ -443,7 +621,7 @@ class AlertManager:
         """
         alert_key = f"container_{container_name}_{issue_type}"
         
-        state = self._states.get(alert_key)
+        state = self.get_state(alert_key)
         if state is None or not state.is_active:
             return False
         
@@ -458,7 +636,9 @@ class AlertManager:
         
         state.is_active = False
         state.first_triggered = None
-        self._save_state()
+        self._index_state(state)
+        self._mark_dirty(alert_key)
+        self._schedule_flush()
         
         return alert_sent
     
@@ -466,19 +646,29 @@ class AlertManager:
     # Statistics
     # =========================================================================
     
-    def get_statistics(self) -> dict:
-        """Get alert statistics for reporting."""
-        active_count = len([s for s in self._states.values() if s.is_active])
-        total_triggers = sum(s.trigger_count for s in self._states.values())
+    def get_state_dicts(self) -> dict[str, dict[str, Any]]:
+        """Get all alert states serialized as dictionaries."""
+        return dict(self._refresh_state_dicts())
+    
+    def get_statistics(self, include_states: bool = False) -> dict:
+        """
+        Get alert statistics for reporting.
         
+        Args:
+            include_states: Also include every serialized alert state
+        """
         by_level = {
-            "warning": len([s for s in self._states.values() if s.is_active and s.level == AlertLevel.WARNING]),
-            "critical": len([s for s in self._states.values() if s.is_active and s.level == AlertLevel.CRITICAL]),
+            "warning": len(self._active_by_level[AlertLevel.WARNING]),
+            "critical": len(self._active_by_level[AlertLevel.CRITICAL]),
         }
         
-        return {
-            "active_alerts": active_count,
-            "total_triggers": total_triggers,
+        stats = {
+            "active_alerts": len(self._active_keys),
+            "total_triggers": self._total_triggers,
             "by_level": by_level,
-            "states": {k: v.to_dict() for k, v in self._states.items()},
         }
+        
+        if include_states:
+            stats["states"] = self.get_state_dicts()
+        
+        return stats
@@ -23,31 +23,56 @@ class AlertLevel(Enum):
     @property
     def emoji(self) -> str:
         """Get emoji for this alert level."""
-        emojis = {
-            AlertLevel.INFO: "ℹ️",
-            AlertLevel.WARNING: "⚠️",
-            AlertLevel.CRITICAL: "🚨",
-            AlertLevel.RECOVERY: "✅",
-        }
-        return emojis.get(self, "ℹ️")
+        return self._emoji
     
     @property
     def color_hex(self) -> int:
         """Get Discord color for this alert level."""
-        colors = {
-            AlertLevel.INFO: 0x3498DB,      # Blue
-            AlertLevel.WARNING: 0xF39C12,   # Orange
-            AlertLevel.CRITICAL: 0xE74C3C,  # Red
-            AlertLevel.RECOVERY: 0x2ECC71,  # Green
-        }
-        return colors.get(self, 0x3498DB)
+        return self._color_hex
+    
+    @property
+    def title(self) -> str:
+        """Get display name for this alert level (e.g. "Warning")."""
+        return self._title
     
     def __lt__(self, other: "AlertLevel") -> bool:
         """Compare alert levels for severity ordering."""
-        order = [AlertLevel.INFO, AlertLevel.WARNING, AlertLevel.CRITICAL]
-        if self not in order or other not in order:
+        rank = _LEVEL_RANK.get(self)
+        other_rank = _LEVEL_RANK.get(other)
+        if rank is None or other_rank is None:
             return False
-        return order.index(self) < order.index(other)
+        return rank < other_rank
+
+
+# Lookup tables for AlertLevel (built once at import time)
+_LEVEL_EMOJI = {
+    AlertLevel.INFO: "ℹ️",
+    AlertLevel.WARNING: "⚠️",
+    AlertLevel.CRITICAL: "🚨",
+    AlertLevel.RECOVERY: "✅",
+}
+
+_LEVEL_COLOR = {
+    AlertLevel.INFO: 0x3498DB,      # Blue
+    AlertLevel.WARNING: 0xF39C12,   # Orange
+    AlertLevel.CRITICAL: 0xE74C3C,  # Red
+    AlertLevel.RECOVERY: 0x2ECC71,  # Green
+}
+
+# Attach emoji/color/title directly to each member so the properties are
+# a plain attribute read
+for _level in AlertLevel:
+    _level._emoji = _LEVEL_EMOJI[_level]
+    _level._color_hex = _LEVEL_COLOR[_level]
+    _level._title = _level.value.title()
+del _level
+
+# Severity ordering (RECOVERY is not comparable)
+_LEVEL_RANK = {
+    AlertLevel.INFO: 0,
+    AlertLevel.WARNING: 1,
+    AlertLevel.CRITICAL: 2,
+}
 
 
 class MetricType(Enum):
@@ -63,7 +88,7 @@ class MetricType(Enum):
     ARRAY_STATUS = "array_status"
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertState:
     """
     Represents the current state of an alert.
@@ -129,12 +154,15 @@ class AlertState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricReading:
     """
     A single metric reading from monitoring.
     
     Contains the raw value, thresholds, and metadata about the metric.
+    Treat `metric_type`, `metric_id`, `context` and the thresholds as
+    read-only after construction - derived values are computed from them
+    once and cached.
     """
     
     # Type of metric
@@ -164,6 +192,40 @@ class MetricReading:
     # Timestamp of reading
     timestamp: datetime = field(default_factory=datetime.now)
     
+    # Caches for alert_key/context_fields (slots leave no __dict__ for cached_property)
+    _alert_key: str | None = field(default=None, init=False, repr=False, compare=False)
+    _context_fields: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Thresholds normalized once in __post_init__ for the per-reading checks
+    _critical: float = field(init=False, repr=False, compare=False)
+    _warning: float = field(init=False, repr=False, compare=False)
+    _recovery_base: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        inf = float("inf")
+        self._critical = inf if self.critical_threshold is None else self.critical_threshold
+        self._warning = inf if self.warning_threshold is None else self.warning_threshold
+        self._recovery_base = self.warning_threshold or 0
+    
+    @property
+    def alert_key(self) -> str:
+        """Key of the AlertState tracking this metric (e.g. "disk_mnt_user")."""
+        if self._alert_key is None:
+            self._alert_key = f"{self.metric_type.value}_{self.metric_id}"
+        return self._alert_key
+    
+    @property
+    def context_fields(self) -> list[dict[str, Any]]:
+        """Context as Discord embed fields (built once per reading)."""
+        if self._context_fields is None:
+            self._context_fields = [
+                {"name": key, "value": str(value), "inline": True}
+                for key, value in self.context.items()
+            ]
+        return self._context_fields
+    
     def get_alert_level(self) -> AlertLevel | None:
         """
         Determine if this reading should trigger an alert.
@@ -171,9 +233,10 @@ class MetricReading:
         Returns:
             AlertLevel if threshold exceeded, None otherwise
         """
-        if self.critical_threshold is not None and self.value >= self.critical_threshold:
+        value = self.value
+        if value >= self._critical:
             return AlertLevel.CRITICAL
-        if self.warning_threshold is not None and self.value >= self.warning_threshold:
+        if value >= self._warning:
             return AlertLevel.WARNING
         return None
     
@@ -187,11 +250,10 @@ class MetricReading:
         Returns:
             True if above threshold (minus hysteresis)
         """
-        effective_warning = (self.warning_threshold or 0) - hysteresis_percent
-        return self.value >= effective_warning
+        return self.value >= self._recovery_base - hysteresis_percent
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerStatus:
     """Status of a Docker container."""
     
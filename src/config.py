@@ -11,13 +11,23 @@ Environment variables take precedence over YAML for any overlapping settings.
 from __future__ import annotations
 
 import os
+import copy
 import logging
+from collections.abc import Mapping
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+# libyaml-backed loader when available (much faster than the pure-Python one)
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 
 logger = logging.getLogger(__name__)
 
@@ -26,49 +36,59 @@ logger = logging.getLogger(__name__)
 # Default configuration values
 # =============================================================================
 
-DEFAULT_CONFIG = {
-    "monitoring": {
+# Immutable (MappingProxyType / tuples) so the defaults can be shared by
+# every load without defensive copies.
+
+_DEFAULT_CPU_THRESHOLDS = MappingProxyType({"warning": 80, "critical": 95})
+_DEFAULT_MEMORY_THRESHOLDS = MappingProxyType({"warning": 85, "critical": 95})
+_DEFAULT_DISK_THRESHOLDS = MappingProxyType({"warning": 80, "critical": 95})
+_DEFAULT_TEMPERATURE_THRESHOLDS = MappingProxyType({"warning": 75, "critical": 90})  # Higher thresholds for NVMe
+
+DEFAULT_CONFIG: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "monitoring": MappingProxyType({
         "system_interval_seconds": 300,
         "docker_interval_seconds": 60,
         "services_interval_seconds": 3600,
-    },
-    "disk_monitoring": {
-        "include_mounts": ["/mnt/user", "/mnt/cache", "/mnt/disk"],
-        "exclude_mounts": ["/boot"],
-        "ignore_fstypes": ["squashfs", "tmpfs", "devtmpfs", "overlay"],
-    },
-    "thresholds": {
-        "cpu": {"warning": 80, "critical": 95},
-        "memory": {"warning": 85, "critical": 95},
-        "disk": {"warning": 80, "critical": 95},
-        "temperature": {"warning": 75, "critical": 90},  # Higher thresholds for NVMe
-    },
-    "alerts": {
+        "health_check_timeout_seconds": 5.0,
+    }),
+    "disk_monitoring": MappingProxyType({
+        "include_mounts": ("/mnt/user", "/mnt/cache", "/mnt/disk"),
+        "exclude_mounts": ("/boot",),
+        "ignore_fstypes": ("squashfs", "tmpfs", "devtmpfs", "overlay"),
+    }),
+    "thresholds": MappingProxyType({
+        "cpu": _DEFAULT_CPU_THRESHOLDS,
+        "memory": _DEFAULT_MEMORY_THRESHOLDS,
+        "disk": _DEFAULT_DISK_THRESHOLDS,
+        "temperature": _DEFAULT_TEMPERATURE_THRESHOLDS,
+    }),
+    "alerts": MappingProxyType({
         "cooldown_minutes": 30,
         "recovery_enabled": True,
         "hysteresis_percent": 5,
-    },
-    "weekly_report": {
+    }),
+    "weekly_report": MappingProxyType({
         "enabled": True,
         "day": "sunday",
         "hour": 9,
         "minute": 0,
-    },
-    "docker": {
+    }),
+    "docker": MappingProxyType({
         "monitor_restarts": True,
         "restart_threshold": 3,
         "restart_window_minutes": 60,
-        "ignored_containers": ["unraid-monitor"],
-    },
-    "logging": {
+        "ignored_containers": ("unraid-monitor",),
+        "max_stat_concurrency": 16,
+    }),
+    "logging": MappingProxyType({
         "level": "INFO",
         "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    },
-    "temperature_sensors": {
-        "whitelist": ["coretemp", "nvme"],  # Only CPU and NVMe
-        "blacklist": [],
-    },
-}
+    }),
+    "temperature_sensors": MappingProxyType({
+        "whitelist": ("coretemp", "nvme"),  # Only CPU and NVMe
+        "blacklist": (),
+    }),
+})
 
 
 # =============================================================================
@@ -91,12 +111,12 @@ class ThresholdsConfig:
     temperature: ThresholdConfig
     
     @classmethod
-    def from_dict(cls, data: dict) -> "ThresholdsConfig":
+    def from_dict(cls, data: Mapping) -> "ThresholdsConfig":
         return cls(
-            cpu=ThresholdConfig(**data.get("cpu", DEFAULT_CONFIG["thresholds"]["cpu"])),
-            memory=ThresholdConfig(**data.get("memory", DEFAULT_CONFIG["thresholds"]["memory"])),
-            disk=ThresholdConfig(**data.get("disk", DEFAULT_CONFIG["thresholds"]["disk"])),
-            temperature=ThresholdConfig(**data.get("temperature", DEFAULT_CONFIG["thresholds"]["temperature"])),
+            cpu=ThresholdConfig(**data.get("cpu", _DEFAULT_CPU_THRESHOLDS)),
+            memory=ThresholdConfig(**data.get("memory", _DEFAULT_MEMORY_THRESHOLDS)),
+            disk=ThresholdConfig(**data.get("disk", _DEFAULT_DISK_THRESHOLDS)),
+            temperature=ThresholdConfig(**data.get("temperature", _DEFAULT_TEMPERATURE_THRESHOLDS)),
         )
 
 
@@ -106,6 +126,7 @@ class MonitoringConfig:
     system_interval_seconds: int = 300
     docker_interval_seconds: int = 60
     services_interval_seconds: int = 3600
+    health_check_timeout_seconds: float = 5.0
 
 
 @dataclass
@@ -131,6 +152,11 @@ class WeeklyReportConfig:
     day: str = "sunday"
     hour: int = 9
     minute: int = 0
+    
+    @property
+    def weekday(self) -> int:
+        """Report day as datetime.weekday() (Monday=0); unknown names fall back to Sunday."""
+        return _WEEKDAY_INDEX.get(self.day.lower(), 6)
 
 
 @dataclass
@@ -140,6 +166,7 @@ class DockerConfig:
     restart_threshold: int = 3
     restart_window_minutes: int = 60
     ignored_containers: list[str] = field(default_factory=lambda: ["unraid-monitor"])
+    max_stat_concurrency: int = 16
 
 
 @dataclass
@@ -184,6 +211,14 @@ class TemperatureSensorsConfig:
 # Main configuration class
 # =============================================================================
 
+# Validation constants
+_WEBHOOK_URL_PREFIX = "https://discord.com/api/webhooks/"
+_THRESHOLD_METRICS = ("cpu", "memory", "disk", "temperature")
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_VALID_DAYS = frozenset(_WEEKDAYS)
+_WEEKDAY_INDEX = MappingProxyType({day: index for index, day in enumerate(_WEEKDAYS)})
+
+
 @dataclass
 class Config:
     """
@@ -225,77 +260,120 @@ class Config:
         
         if not self.discord_webhook_url:
             errors.append("DISCORD_WEBHOOK_URL is required")
-        elif not self.discord_webhook_url.startswith("https://discord.com/api/webhooks/"):
+        elif not self.discord_webhook_url.startswith(_WEBHOOK_URL_PREFIX):
             errors.append("DISCORD_WEBHOOK_URL must be a valid Discord webhook URL")
         
         # Validate thresholds
-        for metric in ["cpu", "memory", "disk", "temperature"]:
+        for metric in _THRESHOLD_METRICS:
             threshold = getattr(self.thresholds, metric)
             if threshold.warning >= threshold.critical:
                 errors.append(f"Threshold {metric}: warning ({threshold.warning}) must be less than critical ({threshold.critical})")
         
         # Validate weekly report day
-        valid_days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        if self.weekly_report.day.lower() not in valid_days:
-            errors.append(f"Weekly report day must be one of: {', '.join(valid_days)}")
+        if self.weekly_report.day.lower() not in _VALID_DAYS:
+            errors.append(f"Weekly report day must be one of: {', '.join(_WEEKDAYS)}")
+        
+        # Validate Docker stat concurrency (0 would hang every container check)
+        if self.docker.max_stat_concurrency < 1:
+            errors.append(f"Docker max_stat_concurrency must be at least 1 (got {self.docker.max_stat_concurrency})")
         
         return errors
 
 
-def _deep_merge(base: dict, override: dict) -> dict:
+def _section(data: Mapping, name: str) -> dict[str, Any]:
+    """Settings section as dataclass kwargs (frozen tuple defaults become lists)."""
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in data.get(name, {}).items()
+    }
+
+
+def _config_from_dict(data: Mapping) -> Config:
+    """Build a Config from a merged settings mapping (env-backed fields left at defaults)."""
+    return Config(
+        monitoring=MonitoringConfig(**_section(data, "monitoring")),
+        disk_monitoring=DiskMonitoringConfig(**_section(data, "disk_monitoring")),
+        thresholds=ThresholdsConfig.from_dict(data.get("thresholds", {})),
+        alerts=AlertsConfig(**_section(data, "alerts")),
+        weekly_report=WeeklyReportConfig(**_section(data, "weekly_report")),
+        docker=DockerConfig(**_section(data, "docker")),
+        logging=LoggingConfig(**_section(data, "logging")),
+        temperature_sensors=TemperatureSensorsConfig(**_section(data, "temperature_sensors")),
+    )
+
+
+# Built once from DEFAULT_CONFIG; copied when settings.yaml is missing or empty
+_DEFAULT_CONFIG_TEMPLATE = _config_from_dict(DEFAULT_CONFIG)
+
+
+def _deep_merge(base: Mapping, override: Mapping) -> dict:
     """
     Deep merge two dictionaries.
     
     Values from 'override' take precedence over 'base'.
+    Works with read-only mappings (e.g. DEFAULT_CONFIG); 'base' is never modified.
     """
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    result = dict(base)
+    # Walk nested levels with an explicit stack; each merged level is copied once
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            existing = dst.get(key)
+            if type(value) is dict and isinstance(existing, Mapping):
+                merged = dict(existing)
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
     return result
 
 
 def _load_yaml_config(config_path: Path) -> dict:
-    """Load configuration from YAML file."""
-    if not config_path.exists():
+    """
+    Load configuration from YAML file.
+    
+    Parsed results are cached by (path, mtime, size), so reloading an
+    unchanged file skips the parse. Callers get their own copy.
+    """
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         logger.warning(f"Config file not found: {config_path}, using defaults")
         return {}
     
+    config = _parse_yaml_file(str(config_path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=4)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML file (cached; mtime_ns and size only form the cache key)."""
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        with open(path, "r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=_YAMLLoader)
             return config if config else {}
     except yaml.YAMLError as e:
         logger.error(f"Error parsing YAML config: {e}")
         return {}
 
 
-def _load_services_from_env() -> ServicesConfig:
+def _service_from_env(env: Mapping[str, str], prefix: str, *secrets: str) -> ServiceConfig:
+    """Build a ServiceConfig from <PREFIX>_URL plus the given credential variables."""
+    url = env.get(f"{prefix}_URL")
+    if not url:
+        return ServiceConfig()
+    return ServiceConfig(url=url, **{name.lower(): env.get(f"{prefix}_{name}") for name in secrets})
+
+
+def _load_services_from_env(env: Mapping[str, str] = os.environ) -> ServicesConfig:
     """Load service configurations from environment variables."""
     return ServicesConfig(
-        radarr=ServiceConfig(
-            url=os.getenv("RADARR_URL"),
-            api_key=os.getenv("RADARR_API_KEY"),
-        ),
-        sonarr=ServiceConfig(
-            url=os.getenv("SONARR_URL"),
-            api_key=os.getenv("SONARR_API_KEY"),
-        ),
-        immich=ServiceConfig(
-            url=os.getenv("IMMICH_URL"),
-            api_key=os.getenv("IMMICH_API_KEY"),
-        ),
-        jellyfin=ServiceConfig(
-            url=os.getenv("JELLYFIN_URL"),
-            api_key=os.getenv("JELLYFIN_API_KEY"),
-        ),
-        qbittorrent=ServiceConfig(
-            url=os.getenv("QBITTORRENT_URL"),
-            username=os.getenv("QBITTORRENT_USERNAME"),
-            password=os.getenv("QBITTORRENT_PASSWORD"),
-        ),
+        radarr=_service_from_env(env, "RADARR", "API_KEY"),
+        sonarr=_service_from_env(env, "SONARR", "API_KEY"),
+        immich=_service_from_env(env, "IMMICH", "API_KEY"),
+        jellyfin=_service_from_env(env, "JELLYFIN", "API_KEY"),
+        qbittorrent=_service_from_env(env, "QBITTORRENT", "USERNAME", "PASSWORD"),
     )
 
 
@@ -327,25 +405,19 @@ def load_config(config_dir: Path | str | None = None) -> Config:
     yaml_path = config_dir / "settings.yaml"
     yaml_config = _load_yaml_config(yaml_path)
     
-    # Merge with defaults
-    merged_config = _deep_merge(DEFAULT_CONFIG, yaml_config)
+    # Merge with defaults (skipped entirely when there is nothing to override)
+    if yaml_config:
+        config = _config_from_dict(_deep_merge(DEFAULT_CONFIG, yaml_config))
+    else:
+        config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
     
-    # Build Config object
-    config = Config(
-        discord_webhook_url=os.getenv("DISCORD_WEBHOOK_URL", ""),
-        discord_user_id=os.getenv("DISCORD_USER_ID", ""),
-        discord_report_channel_id=os.getenv("DISCORD_REPORT_CHANNEL_ID", ""),
-        timezone=os.getenv("TZ", "Europe/Warsaw"),
-        monitoring=MonitoringConfig(**merged_config.get("monitoring", {})),
-        disk_monitoring=DiskMonitoringConfig(**merged_config.get("disk_monitoring", {})),
-        thresholds=ThresholdsConfig.from_dict(merged_config.get("thresholds", {})),
-        alerts=AlertsConfig(**merged_config.get("alerts", {})),
-        weekly_report=WeeklyReportConfig(**merged_config.get("weekly_report", {})),
-        docker=DockerConfig(**merged_config.get("docker", {})),
-        services=_load_services_from_env(),
-        logging=LoggingConfig(**merged_config.get("logging", {})),
-        temperature_sensors=TemperatureSensorsConfig(**merged_config.get("temperature_sensors", {})),
-    )
+    # Overlay environment variables
+    env = os.environ
+    config.discord_webhook_url = env.get("DISCORD_WEBHOOK_URL", "")
+    config.discord_user_id = env.get("DISCORD_USER_ID", "")
+    config.discord_report_channel_id = env.get("DISCORD_REPORT_CHANNEL_ID", "")
+    config.timezone = env.get("TZ", "Europe/Warsaw")
+    config.services = _load_services_from_env(env)
     
     # Validate
     errors = config.validate()
@@ -381,3 +453,5 @@ def setup_logging(config: Config) -> None:
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
     
     logger.info(f"Logging configured at {config.logging.level} level")
+    # Logged here rather than at parse time, which runs before logging is set up
+    logger.debug(f"YAML loader: {_YAMLLoader.__name__}")
@@ -9,18 +9,62 @@ from __future__ import annotations
 
 import logging
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 import sqlite3
 import threading
 
-from .models import Settings, AlertRecord, ServiceStatus, SystemStats
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from .models import Settings, AlertRecord, ServiceStatus, SystemStats, _SETTINGS_FIELDS, _as_isoformat
 
 
 logger = logging.getLogger(__name__)
 
 
+# Statement text kept as constants so sqlite3's statement cache always hits
+_INSERT_ALERT_SQL = """INSERT INTO alert_history 
+    (timestamp, level, title, description, metric_name, 
+     current_value, threshold, resolved, resolved_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_UPSERT_SETTING_SQL = """INSERT OR REPLACE INTO settings (key, value, updated_at) 
+    VALUES (?, ?, ?)"""
+
+# Column order matches AlertRecord's fields; NULL text columns come back as ""
+_SELECT_RECENT_ALERTS_SQL = """SELECT id, timestamp, level, title,
+    COALESCE(description, ''), COALESCE(metric_name, ''),
+    COALESCE(current_value, ''), COALESCE(threshold, ''),
+    resolved, resolved_at
+    FROM alert_history ORDER BY timestamp DESC LIMIT ?"""
+
+_INSERT_DEFAULT_SETTING_SQL = """INSERT OR IGNORE INTO settings (key, value, updated_at) 
+    VALUES (?, ?, ?)"""
+
+_RESOLVE_ALERT_SQL = "UPDATE alert_history SET resolved = 1, resolved_at = ? WHERE id = ?"
+
+
+def _alert_params(alert: AlertRecord) -> tuple:
+    """Bind parameters for _INSERT_ALERT_SQL."""
+    return (
+        _as_isoformat(alert.timestamp),
+        alert.level,
+        alert.title,
+        alert.description,
+        alert.metric_name,
+        alert.current_value,
+        alert.threshold,
+        1 if alert.resolved else 0,
+        _as_isoformat(alert.resolved_at),
+    )
+
+
 class Database:
     """
     SQLite database manager for Unraid Monitor.
@@ -28,6 +72,9 @@ class Database:
     Uses synchronous sqlite3 (thread-safe) as aiosqlite adds complexity.
     All operations are quick enough that async isn't needed.
     
+    Each thread gets its own connection; with WAL, readers never block
+    each other and SQLite serializes writers itself.
+    
     Features:
     - Auto-creates schema on first run
     - Settings persistence with defaults
@@ -45,8 +92,9 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = Path(db_path)
-        self._conn: sqlite3.Connection | None = None
-        self._lock = threading.Lock()
+        self._tls = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()  # Guards _connections only
         self._settings_cache: Settings | None = None
     
     def initialize(self) -> None:
@@ -59,40 +107,80 @@ class Database:
             self.db_path = Path("/tmp/unraid_monitor.db")
         
         try:
-            self._conn = sqlite3.connect(
-                str(self.db_path),
-                check_same_thread=False,
-                timeout=10.0,
-            )
-            self._conn.row_factory = sqlite3.Row
-            
             self._create_tables()
             self._ensure_defaults()
             
             logger.info(f"Database initialized at {self.db_path}")
         except sqlite3.OperationalError as e:
             logger.warning(f"Cannot open database at {self.db_path}: {e}, trying /tmp")
+            self.close()
             self.db_path = Path("/tmp/unraid_monitor.db")
-            self._conn = sqlite3.connect(
-                str(self.db_path),
-                check_same_thread=False,
-                timeout=10.0,
-            )
-            self._conn.row_factory = sqlite3.Row
             self._create_tables()
             self._ensure_defaults()
             logger.info(f"Database initialized at {self.db_path} (fallback)")
     
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Connection for the calling thread (opened on first use)."""
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._tls.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to db_path and apply performance pragmas."""
+        # check_same_thread=False only so close() can run from any thread;
+        # each connection is otherwise used by the thread that opened it.
+        # isolation_level=None: autocommit, multi-statement writes use _transaction().
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        
+        # WAL: concurrent readers, far fewer fsyncs than the rollback journal.
+        # Returns the resulting mode (stays "delete" on filesystems without WAL support).
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if journal_mode != "wal":
+            logger.warning(f"SQLite WAL mode unavailable, using journal_mode={journal_mode}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=10000")  # Applies to every statement
+        conn.execute("PRAGMA cache_size=-20000")  # ~20 MB
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        
+        return conn
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block of statements as one explicit write transaction.
+        
+        BEGIN IMMEDIATE takes the write lock up front, so a read-then-write
+        block never has to upgrade its lock (and retry) under WAL.
+        """
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
     def close(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Close all per-thread database connections."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        # Threads lazily reopen on next use
+        self._tls = threading.local()
     
     def _create_tables(self) -> None:
         """Create database tables."""
-        with self._lock:
-            cursor = self._conn.cursor()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
             
             # Settings table (key-value store)
             cursor.execute("""
@@ -124,6 +212,10 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_alert_timestamp 
                 ON alert_history(timestamp DESC)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_alert_level_ts 
+                ON alert_history(level, timestamp)
+            """)
             
             # Schema version
             cursor.execute("""
@@ -138,17 +230,25 @@ class Database:
                 ("schema_version", str(self.SCHEMA_VERSION))
             )
             
-            self._conn.commit()
     
     def _ensure_defaults(self) -> None:
         """Ensure default settings exist."""
-        defaults = Settings()
-        current = self._get_settings_dict()
+        with self._transaction() as conn:
+            current = {row[0] for row in conn.execute("SELECT key FROM settings")}
+            
+            # Add any missing settings in one transaction; OR IGNORE never clobbers
+            # a value another writer stored in the meantime
+            updated_at = datetime.now().isoformat()
+            missing = [
+                (key, self._encode_setting(value), updated_at)
+                for key, value in Settings().to_dict().items()
+                if key not in current
+            ]
+            if missing:
+                conn.executemany(_INSERT_DEFAULT_SETTING_SQL, missing)
         
-        # Add any missing settings
-        for key, value in defaults.to_dict().items():
-            if key not in current:
-                self._set_setting(key, value)
+        if missing:
+            self._settings_cache = None
     
     # =========================================================================
     # Settings Operations
@@ -156,43 +256,47 @@ class Database:
     
     def _get_settings_dict(self) -> dict[str, Any]:
         """Get all settings as dictionary."""
-        with self._lock:
-            cursor = self._conn.cursor()
-            cursor.execute("SELECT key, value FROM settings")
-            rows = cursor.fetchall()
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT key, value FROM settings")
+        rows = cursor.fetchall()
         
-        result = {}
-        for row in rows:
-            key, value = row["key"], row["value"]
-            # Try to parse as JSON (for complex types)
-            try:
-                result[key] = json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                result[key] = value
-        
-        return result
+        return {row["key"]: self._decode_setting(row["value"]) for row in rows}
+    
+    @staticmethod
+    def _decode_setting(value_str: str) -> Any:
+        """Convert a stored setting string back to its value."""
+        try:
+            return json.loads(value_str)
+        except json.JSONDecodeError:
+            # Plain strings written before settings were stored as JSON
+            return value_str
+    
+    @staticmethod
+    def _encode_setting(value: Any) -> str:
+        """Convert a setting value to its stored string form (always JSON)."""
+        if orjson is not None:
+            return orjson.dumps(value, default=str).decode("utf-8")
+        return json.dumps(value, default=str)
     
     def _set_setting(self, key: str, value: Any) -> None:
         """Set a single setting."""
-        # Convert to JSON for storage
-        if isinstance(value, (dict, list)):
-            value_str = json.dumps(value)
-        elif isinstance(value, bool):
-            value_str = json.dumps(value)  # True/False as true/false
-        else:
-            value_str = str(value)
+        self._set_settings({key: value})
+    
+    def _set_settings(self, data: dict[str, Any]) -> None:
+        """Write several settings in one transaction (one commit, one timestamp)."""
+        updated_at = datetime.now().isoformat()
+        rows = [(key, self._encode_setting(value), updated_at) for key, value in data.items()]
         
-        with self._lock:
-            cursor = self._conn.cursor()
-            cursor.execute(
-                """INSERT OR REPLACE INTO settings (key, value, updated_at) 
-                   VALUES (?, ?, ?)""",
-                (key, value_str, datetime.now().isoformat())
-            )
-            self._conn.commit()
+        with self._transaction() as conn:
+            conn.executemany(_UPSERT_SETTING_SQL, rows)
         
-        # Invalidate cache
-        self._settings_cache = None
+        # Update the cached settings in place instead of forcing a full reload.
+        # Values go through the same decode as a fresh load would.
+        cache = self._settings_cache
+        if cache is not None:
+            for key, value_str, _ in rows:
+                if key in _SETTINGS_FIELDS:
+                    setattr(cache, key, self._decode_setting(value_str))
     
     def get_settings(self) -> Settings:
         """
@@ -219,11 +323,7 @@ class Database:
         else:
             data = settings
         
-        for key, value in data.items():
-            self._set_setting(key, value)
-        
-        # Invalidate cache
-        self._settings_cache = None
+        self._set_settings(data)
         logger.info("Settings saved to database")
     
     def update_setting(self, key: str, value: Any) -> None:
@@ -242,54 +342,31 @@ class Database:
         Returns:
             ID of the inserted alert
         """
-        with self._lock:
-            cursor = self._conn.cursor()
-            cursor.execute(
-                """INSERT INTO alert_history 
-                   (timestamp, level, title, description, metric_name, 
-                    current_value, threshold, resolved, resolved_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    alert.timestamp.isoformat(),
-                    alert.level,
-                    alert.title,
-                    alert.description,
-                    alert.metric_name,
-                    alert.current_value,
-                    alert.threshold,
-                    1 if alert.resolved else 0,
-                    alert.resolved_at.isoformat() if alert.resolved_at else None,
-                )
-            )
-            self._conn.commit()
-            return cursor.lastrowid
+        # Single statement: autocommit
+        cursor = self._conn.execute(_INSERT_ALERT_SQL, _alert_params(alert))
+        return cursor.lastrowid
+    
+    def add_alerts_batch(self, alerts: list[AlertRecord]) -> None:
+        """Add several alerts to history in a single transaction."""
+        if not alerts:
+            return
+        
+        with self._transaction() as conn:
+            conn.executemany(_INSERT_ALERT_SQL, [_alert_params(a) for a in alerts])
     
     def get_recent_alerts(self, limit: int = 50) -> list[AlertRecord]:
         """Get most recent alerts."""
-        with self._lock:
-            cursor = self._conn.cursor()
-            cursor.execute(
-                "SELECT * FROM alert_history ORDER BY timestamp DESC LIMIT ?",
-                (limit,)
-            )
-            rows = cursor.fetchall()
-        
-        alerts = []
-        for row in rows:
-            alerts.append(AlertRecord(
-                id=row["id"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                level=row["level"],
-                title=row["title"],
-                description=row["description"] or "",
-                metric_name=row["metric_name"] or "",
-                current_value=row["current_value"] or "",
-                threshold=row["threshold"] or "",
-                resolved=bool(row["resolved"]),
-                resolved_at=datetime.fromisoformat(row["resolved_at"]) if row["resolved_at"] else None,
-            ))
-        
-        return alerts
+        return list(self.iter_recent_alerts(limit))
+    
+    def iter_recent_alerts(self, limit: int = 50) -> Iterator[AlertRecord]:
+        """Yield most recent alerts straight from the cursor (no intermediate row list)."""
+        cursor = self._conn.execute(_SELECT_RECENT_ALERTS_SQL, (limit,))
+        try:
+            # Timestamps stay as the stored ISO strings (see AlertRecord)
+            for row in cursor:
+                yield AlertRecord(*row[:8], resolved=bool(row[8]), resolved_at=row[9])
+        finally:
+            cursor.close()
     
     def get_alert_stats(self, days: int = 7) -> dict[str, int]:
         """
@@ -298,19 +375,13 @@ class Database:
         Returns:
             Dictionary with counts by level
         """
-        since = datetime.now().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        since = since.replace(day=since.day - days + 1)
-        
-        with self._lock:
-            cursor = self._conn.cursor()
-            cursor.execute(
-                """SELECT level, COUNT(*) as count FROM alert_history 
-                   WHERE timestamp >= ? GROUP BY level""",
-                (since.isoformat(),)
-            )
-            rows = cursor.fetchall()
+        # Cutoff computed by SQLite: local midnight (days - 1) days ago.
+        # Timestamps are stored as local ISO strings, so string comparison works.
+        rows = self._conn.execute(
+            """SELECT level, COUNT(*) as count FROM alert_history 
+               WHERE timestamp >= date('now', 'localtime', ?) GROUP BY level""",
+            (f"-{days - 1} days",)
+        ).fetchall()
         
         stats = {"info": 0, "warning": 0, "critical": 0, "recovery": 0, "total": 0}
         for row in rows:
@@ -321,13 +392,7 @@ class Database:
     
     def resolve_alert(self, alert_id: int) -> None:
         """Mark an alert as resolved."""
-        with self._lock:
-            cursor = self._conn.cursor()
-            cursor.execute(
-                "UPDATE alert_history SET resolved = 1, resolved_at = ? WHERE id = ?",
-                (datetime.now().isoformat(), alert_id)
-            )
-            self._conn.commit()
+        self._conn.execute(_RESOLVE_ALERT_SQL, (datetime.now().isoformat(), alert_id))
     
     def cleanup_old_alerts(self, keep_days: int = 30) -> int:
         """
@@ -336,19 +401,11 @@ class Database:
         Returns:
             Number of deleted records
         """
-        cutoff = datetime.now().replace(
-            hour=0, minute=0, second=0, microsecond=0
+        cursor = self._conn.execute(
+            "DELETE FROM alert_history WHERE timestamp < date('now', 'localtime', ?)",
+            (f"-{keep_days} days",)
         )
-        cutoff = cutoff.replace(day=cutoff.day - keep_days)
-        
-        with self._lock:
-            cursor = self._conn.cursor()
-            cursor.execute(
-                "DELETE FROM alert_history WHERE timestamp < ?",
-                (cutoff.isoformat(),)
-            )
-            deleted = cursor.rowcount
-            self._conn.commit()
+        deleted = cursor.rowcount
         
         if deleted > 0:
             logger.info(f"Cleaned up {deleted} old alerts")
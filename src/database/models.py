@@ -6,13 +6,13 @@ These dataclasses represent the data structures stored in the database.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime
 from typing import Any
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """
     Application settings stored in database.
@@ -51,38 +51,56 @@ class Settings:
     web_port: int = 8888
     web_password: str = ""  # Empty = no auth required
     
+    # Parsed temp_sensors, valid while temp_sensors is still _temp_sensors_src
+    _temp_sensors_src: str | None = field(default=None, init=False, repr=False, compare=False)
+    _temp_sensors_cached: list[str] | None = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # All fields are scalars, so asdict's recursive deep copy is unnecessary
+        return {name: getattr(self, name) for name in _SETTINGS_FIELDS}
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Settings":
         """Create from dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        return cls(**{k: v for k, v in data.items() if k in _SETTINGS_FIELDS})
     
     @property
     def temp_sensors_list(self) -> list[str]:
-        """Get temperature sensors as list."""
-        try:
-            return json.loads(self.temp_sensors)
-        except (json.JSONDecodeError, TypeError):
-            return ["coretemp", "nvme"]
+        """Get temperature sensors as list (parsed once per temp_sensors value)."""
+        if self._temp_sensors_cached is None or self.temp_sensors is not self._temp_sensors_src:
+            try:
+                sensors = json.loads(self.temp_sensors)
+            except (json.JSONDecodeError, TypeError):
+                sensors = ["coretemp", "nvme"]
+            self._temp_sensors_src = self.temp_sensors
+            self._temp_sensors_cached = sensors
+        return list(self._temp_sensors_cached)
     
     @temp_sensors_list.setter
     def temp_sensors_list(self, sensors: list[str]) -> None:
         """Set temperature sensors from list."""
         self.temp_sensors = json.dumps(sensors)
+        self._temp_sensors_cached = None
+
 
+# Persisted setting names (excludes the private parse cache)
+_SETTINGS_FIELDS = tuple(f.name for f in fields(Settings) if f.init)
 
-@dataclass
+
+@dataclass(slots=True)
 class AlertRecord:
     """
     Historical alert record.
     
     Stored for statistics and history viewing.
+    
+    Records read back from the database keep timestamp/resolved_at as the
+    stored ISO strings (they are only ever re-serialized); use
+    timestamp_dt / resolved_at_dt when a datetime is needed.
     """
     id: int | None = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime | str = field(default_factory=datetime.now)
     level: str = "info"  # info, warning, critical, recovery
     title: str = ""
     description: str = ""
@@ -90,17 +108,39 @@ class AlertRecord:
     current_value: str = ""
     threshold: str = ""
     resolved: bool = False
-    resolved_at: datetime | None = None
+    resolved_at: datetime | str | None = None
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Alert time as a datetime."""
+        return _as_datetime(self.timestamp)
+    
+    @property
+    def resolved_at_dt(self) -> datetime | None:
+        """Resolution time as a datetime (None if unresolved)."""
+        return _as_datetime(self.resolved_at) if self.resolved_at else None
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         data = asdict(self)
-        data["timestamp"] = self.timestamp.isoformat() if self.timestamp else None
-        data["resolved_at"] = self.resolved_at.isoformat() if self.resolved_at else None
+        data["timestamp"] = _as_isoformat(self.timestamp)
+        data["resolved_at"] = _as_isoformat(self.resolved_at)
         return data
 
 
-@dataclass
+def _as_datetime(value: datetime | str) -> datetime:
+    """Parse an ISO timestamp string; datetimes pass through."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _as_isoformat(value: datetime | str | None) -> str | None:
+    """Format a datetime as ISO; ISO strings pass through."""
+    if not value:
+        return None
+    return value if isinstance(value, str) else value.isoformat()
+
+
+@dataclass(slots=True)
 class ServiceStatus:
     """
     Service connection status for dashboard.
@@ -122,7 +162,7 @@ class ServiceStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemStats:
     """
     Current system statistics for dashboard.
@@ -16,9 +16,22 @@ import logging
 import os
 import signal
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
 
 # Import version from package root
 try:
@@ -26,20 +39,16 @@ try:
 except ImportError:
     __version__ = "1.0.2"  # Fallback
 
-# APScheduler imports (stable 3.x)
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.cron import CronTrigger
-
 # Local imports
 from config import load_config, setup_logging, Config
-from discord_client import DiscordClient
 from database import Database
 from notifications import DiscordProvider, get_provider_from_config
 from web import WebUI
 from alerts.manager import AlertManager
+from monitors.base import BaseMonitor
 from monitors.system import SystemMonitor
 from monitors.docker_monitor import DockerMonitor
+from monitors.services.base import BaseServiceClient
 from monitors.services.radarr import RadarrClient
 from monitors.services.sonarr import SonarrClient
 from monitors.services.immich import ImmichClient
@@ -50,6 +59,28 @@ from reports.weekly import WeeklyReportGenerator
 
 logger = logging.getLogger(__name__)
 
+# Longest single sleep while waiting for the weekly report, so wall-clock
+# changes (host suspend, NTP steps) are noticed within the hour
+_MAX_SCHEDULER_SLEEP_SECONDS = 3600.0
+
+# How long a service health result is reused for Web UI status polls
+_HEALTH_CACHE_TTL_SECONDS = 15.0
+
+# Longest stop() waits for the shutdown notification to be delivered
+_SHUTDOWN_NOTICE_TIMEOUT_SECONDS = 5.0
+
+# (name, client class, ServiceConfig -> constructor kwargs); name matches the
+# ServicesConfig attribute and the WeeklyReportGenerator keyword argument
+_SERVICE_SPECS = (
+    ("radarr", RadarrClient, lambda c: {"base_url": c.url, "api_key": c.api_key}),
+    ("sonarr", SonarrClient, lambda c: {"base_url": c.url, "api_key": c.api_key}),
+    ("immich", ImmichClient, lambda c: {"base_url": c.url, "api_key": c.api_key}),
+    ("jellyfin", JellyfinClient, lambda c: {"base_url": c.url, "api_key": c.api_key}),
+    ("qbittorrent", QBittorrentClient, lambda c: {
+        "base_url": c.url, "username": c.username, "password": c.password,
+    }),
+)
+
 
 class UnraidMonitor:
     """
@@ -61,20 +92,48 @@ class UnraidMonitor:
     def __init__(self, config: Config):
         self.config = config
         self._running = False
-        self._scheduler: AsyncIOScheduler | None = None
+        self._stopped = False
+        self._stop_event = asyncio.Event()
+        self._scheduler_tasks: list[asyncio.Task] = []
         self._web_task: asyncio.Task | None = None
+        self._startup_notice: asyncio.Task | None = None
+        # service name -> (monotonic time checked, connected)
+        self._health_cache: dict[str, tuple[float, bool]] = {}
+        self._health_refresh: asyncio.Task | None = None
+        # monitor name -> in-flight check started by a Web UI poll
+        self._web_probes: dict[str, asyncio.Task] = {}
+        # (Docker check data, Web UI projection of it); rebuilt once per check
+        self._docker_web_view: tuple[dict[str, Any], dict[str, Any]] | None = None
         
         # Initialize Database
         data_dir = Path(os.environ.get("DATA_DIR", "/app/data"))
+        # Tables are created in start(), off the event loop thread
         self.db = Database(data_dir / "unraid_monitor.db")
-        self.db.initialize()
-        logger.info("Database initialized")
+        
+        # Resolve DNS asynchronously through c-ares when aiodns is installed,
+        # instead of getaddrinfo on the default thread pool
+        self._dns_resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+        
+        # One HTTP session (connection pool, DNS cache) shared by Discord and all
+        # service clients. No cookies: services on one IP would see each
+        # other's; qBittorrent keeps its login cookie in a session of its own.
+        self._http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                resolver=self._dns_resolver,
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+            ),
+            timeout=aiohttp.ClientTimeout(total=10),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
         
         # Initialize Discord client
-        self.discord = DiscordClient(
+        self.discord = DiscordProvider(
             webhook_url=config.discord_webhook_url,
             user_id=config.discord_user_id or None,
             report_channel_id=config.discord_report_channel_id or None,
+            session=self._http_session,
         )
         
         # Initialize alert manager
@@ -88,28 +147,12 @@ class UnraidMonitor:
         self.system_monitor = SystemMonitor(config, self.alert_manager)
         self.docker_monitor = DockerMonitor(config, self.alert_manager)
         
-        # Initialize service clients
-        self.radarr = RadarrClient(
-            base_url=config.services.radarr.url,
-            api_key=config.services.radarr.api_key,
-        )
-        self.sonarr = SonarrClient(
-            base_url=config.services.sonarr.url,
-            api_key=config.services.sonarr.api_key,
-        )
-        self.immich = ImmichClient(
-            base_url=config.services.immich.url,
-            api_key=config.services.immich.api_key,
-        )
-        self.jellyfin = JellyfinClient(
-            base_url=config.services.jellyfin.url,
-            api_key=config.services.jellyfin.api_key,
-        )
-        self.qbittorrent = QBittorrentClient(
-            base_url=config.services.qbittorrent.url,
-            username=config.services.qbittorrent.username,
-            password=config.services.qbittorrent.password,
-        )
+        # Initialize service clients (only the configured ones)
+        self.services: dict[str, BaseServiceClient] = {
+            name: client_cls(**client_kwargs(service_config), session=self._http_session)
+            for name, client_cls, client_kwargs in _SERVICE_SPECS
+            if (service_config := getattr(config.services, name)).is_configured
+        }
         
         # Initialize report generator
         self.report_generator = WeeklyReportGenerator(
@@ -118,11 +161,7 @@ class UnraidMonitor:
             alert_manager=self.alert_manager,
             system_monitor=self.system_monitor,
             docker_monitor=self.docker_monitor,
-            radarr=self.radarr,
-            sonarr=self.sonarr,
-            immich=self.immich,
-            jellyfin=self.jellyfin,
-            qbittorrent=self.qbittorrent,
+            **self.services,
         )
         
         # Initialize Web UI
@@ -143,19 +182,28 @@ class UnraidMonitor:
     
     # ==================== Web UI Callbacks ====================
     
+    async def _get_monitor_data_for_web(self, monitor: BaseMonitor) -> dict[str, Any]:
+        """Get a monitor's last check data, running one shared check if there is none."""
+        data = monitor.get_last_data()
+        if data:
+            return data
+        
+        # Concurrent polls await the same check instead of each starting one;
+        # safe_check stores the result so later polls use the cached data
+        task = self._web_probes.get(monitor.name)
+        if task is None or task.done():
+            task = asyncio.create_task(monitor.safe_check())
+            self._web_probes[monitor.name] = task
+        return await asyncio.shield(task) or {}
+    
     async def _get_system_stats_for_web(self) -> dict[str, Any]:
         """Get system stats for Web UI."""
         try:
             # Use last cached data or run a fresh check
-            stats = self.system_monitor.get_last_data()
-            if not stats:
-                stats = await self.system_monitor.check()
+            stats = await self._get_monitor_data_for_web(self.system_monitor)
 
             disks = stats.get("disks", [])
-            main_disk = next(
-                (d for d in disks if d.get("mountpoint") == "/mnt/user"),
-                disks[0] if disks else {}
-            )
+            main_disk = stats.get("disks_by_mount", {}).get("/mnt/user") or (disks[0] if disks else {})
             
             # Calculate uptime
             try:
@@ -165,11 +213,14 @@ class UnraidMonitor:
             except Exception:
                 uptime_seconds = 0
             
+            cpu = stats.get("cpu") or {}
+            memory = stats.get("memory") or {}
+            
             return {
-                "cpu_percent": stats.get("cpu", {}).get("percent", 0),
-                "memory_percent": stats.get("memory", {}).get("percent", 0),
-                "memory_used": stats.get("memory", {}).get("used_bytes", 0),
-                "memory_total": stats.get("memory", {}).get("total_bytes", 0),
+                "cpu_percent": cpu.get("percent", 0),
+                "memory_percent": memory.get("percent", 0),
+                "memory_used": memory.get("used_bytes", 0),
+                "memory_total": memory.get("total_bytes", 0),
                 "disk_percent": main_disk.get("percent", 0),
                 "disks": disks,
                 "temperatures": stats.get("temperatures", {}),
@@ -184,14 +235,16 @@ class UnraidMonitor:
         """Get Docker stats for Web UI."""
         try:
             # Use last cached data or run a fresh check
-            data = self.docker_monitor.get_last_data()
-            if not data:
-                data = await self.docker_monitor.check()
+            data = await self._get_monitor_data_for_web(self.docker_monitor)
+            
+            # Polls between two checks see the same data object; reuse its projection
+            if self._docker_web_view is not None and self._docker_web_view[0] is data:
+                return self._docker_web_view[1]
             
             containers = data.get("containers", [])
             summary = data.get("summary", {})
             
-            return {
+            view = {
                 "containers": [
                     {
                         "name": c.get("name", "Unknown"),
@@ -207,36 +260,52 @@ class UnraidMonitor:
                 "stopped": summary.get("stopped", 0),
                 "unhealthy": summary.get("unhealthy", 0),
             }
+            self._docker_web_view = (data, view)
+            return view
         except Exception as e:
             logger.error(f"Error getting Docker stats for web: {e}")
             return {"containers": [], "total": 0, "running": 0}
     
+    async def _refresh_service_health(self, clients: dict[str, BaseServiceClient]) -> None:
+        """Re-check the given services concurrently and update the health cache."""
+        timeout = self.config.monitoring.health_check_timeout_seconds
+        results = await asyncio.gather(
+            *(asyncio.wait_for(client.health_check(), timeout) for client in clients.values()),
+            return_exceptions=True,
+        )
+        checked_at = time.monotonic()
+        for name, result in zip(clients, results):
+            # Exceptions (including timeouts) count as disconnected
+            self._health_cache[name] = (checked_at, result is True)
+    
     async def _get_services_status_for_web(self) -> dict[str, dict[str, Any]]:
         """Get services connection status for Web UI."""
-        services = {}
-        
-        # Check each service
-        service_checks = [
-            ("radarr", self.radarr, self.config.services.radarr.is_configured),
-            ("sonarr", self.sonarr, self.config.services.sonarr.is_configured),
-            ("immich", self.immich, self.config.services.immich.is_configured),
-            ("jellyfin", self.jellyfin, self.config.services.jellyfin.is_configured),
-            ("qbittorrent", self.qbittorrent, self.config.services.qbittorrent.is_configured),
-        ]
-        
-        for name, client, is_configured in service_checks:
-            if not is_configured:
-                services[name] = {"configured": False, "connected": False}
-                continue
-            
-            try:
-                # Try to get health from service
-                connected = await client.health_check()
-                services[name] = {"configured": True, "connected": connected}
-            except Exception:
-                services[name] = {"configured": True, "connected": False}
+        now = time.monotonic()
+        stale = {
+            name: client
+            for name, client in self.services.items()
+            if name not in self._health_cache
+            or now - self._health_cache[name][0] >= _HEALTH_CACHE_TTL_SECONDS
+        }
         
-        return services
+        # Stale entries are refreshed by a single background task; polls keep
+        # answering from the cache so a slow upstream never holds them up
+        if stale and (self._health_refresh is None or self._health_refresh.done()):
+            self._health_refresh = asyncio.create_task(self._refresh_service_health(stale))
+        
+        # Only wait when a service has never been checked (nothing to show yet)
+        refresh = self._health_refresh
+        if refresh is not None and not refresh.done():
+            if any(name not in self._health_cache for name in self.services):
+                await asyncio.shield(refresh)
+        
+        return {
+            name: {
+                "configured": name in self.services,
+                "connected": self._health_cache.get(name, (0.0, False))[1],
+            }
+            for name, _, _ in _SERVICE_SPECS
+        }
     
     async def _trigger_report_for_web(self) -> bool:
         """Trigger weekly report generation from Web UI."""
@@ -267,82 +336,84 @@ class UnraidMonitor:
         logger.info("Starting Unraid Monitor...")
         self._running = True
         
+        # Initialize Database (file I/O can stall on a spinning-up array)
+        await asyncio.to_thread(self.db.initialize)
+        
+        # Send startup notification while the initial checks run; only once
+        # the database is up, so a failed start never announces itself
+        self._startup_notice = asyncio.create_task(self.discord.send_startup_message())
+        
         # Start Web UI in background
         self._web_task = asyncio.create_task(self.web_ui.start())
         logger.info(f"Web UI started on http://0.0.0.0:{self.web_ui.port}")
         
-        # Send startup notification
-        await self.discord.send_startup_message()
-        
-        # Create scheduler (APScheduler 3.x stable)
-        self._scheduler = AsyncIOScheduler()
+        # Run initial checks
+        logger.info("Running initial checks...")
+        await self._run_system_check()
+        await self._run_docker_check()
+        await self._startup_notice
         
         # Schedule system monitoring
-        self._scheduler.add_job(
-            self._run_system_check,
-            IntervalTrigger(seconds=self.config.monitoring.system_interval_seconds),
-            id="system_monitor",
-        )
-        logger.info(f"System monitor scheduled every {self.config.monitoring.system_interval_seconds}s")
+        system_interval = self.config.monitoring.system_interval_seconds
+        self._scheduler_tasks.append(asyncio.create_task(
+            _run_every(system_interval, self._run_system_check)
+        ))
+        logger.info(f"System monitor scheduled every {system_interval}s")
         
         # Schedule Docker monitoring
-        self._scheduler.add_job(
-            self._run_docker_check,
-            IntervalTrigger(seconds=self.config.monitoring.docker_interval_seconds),
-            id="docker_monitor",
-        )
-        logger.info(f"Docker monitor scheduled every {self.config.monitoring.docker_interval_seconds}s")
+        docker_interval = self.config.monitoring.docker_interval_seconds
+        self._scheduler_tasks.append(asyncio.create_task(
+            _run_every(docker_interval, self._run_docker_check)
+        ))
+        logger.info(f"Docker monitor scheduled every {docker_interval}s")
         
         # Schedule weekly report
         if self.config.weekly_report.enabled:
-            # Map day name to cron day_of_week
-            day_map = {
-                "monday": "mon",
-                "tuesday": "tue",
-                "wednesday": "wed",
-                "thursday": "thu",
-                "friday": "fri",
-                "saturday": "sat",
-                "sunday": "sun",
-            }
-            day = day_map.get(self.config.weekly_report.day.lower(), "sun")
-            
-            self._scheduler.add_job(
-                self._run_weekly_report,
-                CronTrigger(
-                    day_of_week=day,
-                    hour=self.config.weekly_report.hour,
-                    minute=self.config.weekly_report.minute,
-                ),
-                id="weekly_report",
-            )
+            self._scheduler_tasks.append(asyncio.create_task(
+                _run_weekly(
+                    self.config.weekly_report.weekday,
+                    self.config.weekly_report.hour,
+                    self.config.weekly_report.minute,
+                    self._run_weekly_report,
+                )
+            ))
             logger.info(
                 f"Weekly report scheduled for {self.config.weekly_report.day} "
                 f"at {self.config.weekly_report.hour:02d}:{self.config.weekly_report.minute:02d}"
             )
         
-        # Run initial checks
-        logger.info("Running initial checks...")
-        await self._run_system_check()
-        await self._run_docker_check()
-        
-        # Start scheduler
-        self._scheduler.start()
         logger.info("Unraid Monitor is running. Press Ctrl+C to stop.")
         
         # Keep running until stopped
-        while self._running:
-            await asyncio.sleep(1)
+        await self._stop_event.wait()
     
     async def stop(self) -> None:
-        """Stop the monitor gracefully."""
+        """Stop the monitor gracefully (safe to call more than once)."""
+        if self._stopped:
+            return
+        self._stopped = True
+        
         logger.info("Stopping Unraid Monitor...")
         self._running = False
+        self._stop_event.set()
         
-        # Stop scheduler
-        if self._scheduler and self._scheduler.running:
-            self._scheduler.shutdown(wait=False)
+        # Send shutdown notification while the rest shuts down
+        shutdown_notice = asyncio.create_task(self.discord.send_shutdown_message())
+        
+        # Stop scheduled jobs, in-flight Web UI checks and a startup notice
+        # still pending if start() was interrupted (before the session they
+        # use is closed)
+        background = [*self._scheduler_tasks, *self._web_probes.values()]
+        for task in (self._health_refresh, self._startup_notice):
+            if task is not None:
+                background.append(task)
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        if self._scheduler_tasks:
+            self._scheduler_tasks.clear()
             logger.info("Scheduler stopped")
+        self._web_probes.clear()
         
         # Stop Web UI
         if self._web_task and not self._web_task.done():
@@ -354,16 +425,30 @@ class UnraidMonitor:
                 pass
             logger.info("Web UI stopped")
         
-        # Send shutdown notification
-        await self.discord.send_shutdown_message()
+        # Persist pending alert state while the notification finishes (bounded,
+        # so an unreachable Discord cannot stall shutdown); one failing must
+        # not keep the other from running
+        results = await asyncio.gather(
+            asyncio.wait_for(shutdown_notice, _SHUTDOWN_NOTICE_TIMEOUT_SECONDS),
+            self.alert_manager.close(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error during shutdown cleanup: {result!r}")
+        
+        # Sessions clients opened over the shared connection pool go first
+        await asyncio.gather(
+            *(client.close() for client in self.services.values()),
+            return_exceptions=True,
+        )
+        
+        # Close the shared HTTP session (after the notification used it)
+        await self._http_session.close()
         
-        # Close HTTP sessions
-        await self.discord.close()
-        await self.radarr.close()
-        await self.sonarr.close()
-        await self.immich.close()
-        await self.jellyfin.close()
-        await self.qbittorrent.close()
+        # The connector only closes resolvers it created itself
+        if self._dns_resolver is not None:
+            await self._dns_resolver.close()
         
         logger.info("Unraid Monitor stopped.")
     
@@ -392,6 +477,50 @@ class UnraidMonitor:
             logger.error(f"Error generating weekly report: {e}", exc_info=True)
 
 
+# ==================== Scheduling ====================
+
+async def _run_every(interval: float, job: Callable[[], Awaitable[None]]) -> None:
+    """
+    Run job every interval seconds until cancelled.
+    
+    Runs are aligned to a monotonic grid started now (no drift from job
+    duration); runs missed while a slow job was still going are skipped.
+    """
+    loop = asyncio.get_running_loop()
+    next_run = loop.time() + interval
+    while True:
+        await asyncio.sleep(max(0.0, next_run - loop.time()))
+        await job()
+        
+        now = loop.time()
+        next_run += interval
+        if next_run <= now:
+            next_run += ((now - next_run) // interval + 1) * interval
+
+
+def _next_weekly_run(now: datetime, weekday: int, hour: int, minute: int) -> datetime:
+    """Next local time after now that falls on weekday at hour:minute."""
+    run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    run_at += timedelta(days=(weekday - now.weekday()) % 7)
+    if run_at <= now:
+        run_at += timedelta(days=7)
+    return run_at
+
+
+async def _run_weekly(
+    weekday: int,
+    hour: int,
+    minute: int,
+    job: Callable[[], Awaitable[None]],
+) -> None:
+    """Run job every week on weekday at hour:minute local time until cancelled."""
+    while True:
+        run_at = _next_weekly_run(datetime.now(), weekday, hour, minute).timestamp()
+        while (remaining := run_at - time.time()) > 0:
+            await asyncio.sleep(min(remaining, _MAX_SCHEDULER_SLEEP_SECONDS))
+        await job()
+
+
 async def main() -> None:
     """Main entry point."""
     # Load configuration
@@ -436,28 +565,38 @@ async def main() -> None:
     monitor = UnraidMonitor(config)
     
     # Handle shutdown signals
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
     
     def signal_handler(sig):
         logger.info(f"Received signal {sig}, shutting down...")
-        # Don't call loop.stop() - let monitor.stop() complete gracefully
-        asyncio.create_task(monitor.stop())
+        # Only wake main(); the shutdown itself is awaited there
+        stop_event.set()
     
     # Register signal handlers
     for sig in (signal.SIGTERM, signal.SIGINT):
         try:
-            loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
+            loop.add_signal_handler(sig, signal_handler, sig)
         except NotImplementedError:
             # Windows doesn't support add_signal_handler
             pass
     
+    start_task = asyncio.create_task(monitor.start())
+    stop_task = asyncio.create_task(stop_event.wait())
     try:
-        await monitor.start()
-    except KeyboardInterrupt:
-        logger.info("Keyboard interrupt received")
+        # Run until a signal arrives or start() exits on its own (e.g. an error)
+        await asyncio.wait({start_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
     finally:
         await monitor.stop()
+        start_task.cancel()
+        stop_task.cancel()
+        start_result, _ = await asyncio.gather(start_task, stop_task, return_exceptions=True)
+    
+    if isinstance(start_result, Exception):
+        raise start_result
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop when installed, stdlib event loop otherwise
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(main())
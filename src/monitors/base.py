@@ -8,6 +8,7 @@ This provides a consistent interface for the scheduler.
 from __future__ import annotations
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
@@ -18,6 +19,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# While a monitor keeps failing, only every Nth error log carries a traceback
+_TRACEBACK_EVERY_N_FAILURES = 60
+
 
 class BaseMonitor(ABC):
     """
@@ -44,6 +48,8 @@ class BaseMonitor(ABC):
         self.config = config
         self.alert_manager = alert_manager
         self._last_check_data: dict[str, Any] = {}
+        self._last_check_ts: float = 0.0  # time.monotonic() of the last successful check
+        self._consecutive_failures = 0
     
     @property
     @abstractmethod
@@ -85,12 +91,27 @@ class BaseMonitor(ABC):
         """
         try:
             result = await self.check()
-            self._last_check_data = result
-            return result
         except Exception as e:
-            logger.error(f"Error in {self.name} monitor: {e}", exc_info=True)
+            # Full traceback on the first failure and every Nth repeat only
+            failures = self._consecutive_failures
+            self._consecutive_failures += 1
+            logger.error(
+                f"Error in {self.name} monitor (failure #{failures + 1}): {e}",
+                exc_info=failures % _TRACEBACK_EVERY_N_FAILURES == 0,
+            )
             return None
+        
+        if self._consecutive_failures:
+            logger.info(f"{self.name} monitor recovered after {self._consecutive_failures} failed checks")
+            self._consecutive_failures = 0
+        self._last_check_data = result
+        self._last_check_ts = time.monotonic()
+        return result
     
     def get_last_data(self) -> dict[str, Any]:
         """Get data from the last successful check."""
         return self._last_check_data
+    
+    def is_fresh(self, max_age: float) -> bool:
+        """Check if the last successful check is younger than max_age seconds."""
+        return bool(self._last_check_data) and time.monotonic() - self._last_check_ts < max_age
@@ -12,11 +12,17 @@ Uses the Docker SDK (docker-py) via the mounted Docker socket.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import time
+from dataclasses import asdict
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import docker
+import psutil
 from docker.errors import DockerException
 
 from monitors.base import BaseMonitor
@@ -29,6 +35,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Container cgroup v2 directories under the cgroup root, for the cgroupfs
+# and systemd cgroup drivers
+_CGROUP_DIR_PATTERNS = ("docker/{id}", "system.slice/docker-{id}.scope")
+
+# Gap between two CPU samples when a container has no usable previous one
+# (first check, or a restart reset its counters); same as the stats API's
+# own sampling interval
+_CPU_BASELINE_SAMPLE_SECONDS = 1.0
+
+
+def _cgroup_usage_usec(cpu_stat: str) -> int:
+    """Total CPU time (usage_usec) from the contents of a cgroup v2 cpu.stat file."""
+    return next(
+        (int(line.split()[1]) for line in cpu_stat.splitlines() if line.startswith("usage_usec ")),
+        0,
+    )
+
 
 class DockerMonitor(BaseMonitor):
     """
@@ -52,6 +75,20 @@ class DockerMonitor(BaseMonitor):
         
         # Track restart counts over time window
         self._restart_history: dict[str, list[datetime]] = {}
+        
+        # Last (container CPU total, system CPU total) per container id
+        self._cpu_samples: dict[str, tuple[int, int]] = {}
+        # Last (cgroup usage_usec, time.monotonic_ns()) per container id
+        self._cgroup_cpu_samples: dict[str, tuple[int, int]] = {}
+        # Host cgroup v2 hierarchy (psutil's HOST_SYS points at the host /sys)
+        self._cgroup_root = Path(os.environ.get("HOST_SYS", "/sys")) / "fs" / "cgroup"
+        
+        self._running_check: asyncio.Task | None = None
+        
+        # Ignore list is fixed for the process lifetime; names compared without leading /
+        self._ignored_names = frozenset(
+            name.lstrip("/") for name in config.docker.ignored_containers
+        )
     
     @property
     def name(self) -> str:
@@ -70,20 +107,25 @@ class DockerMonitor(BaseMonitor):
     
     def _is_ignored(self, container_name: str) -> bool:
         """Check if container should be ignored."""
-        ignored = self.config.docker.ignored_containers
-        
-        # Clean up container name (remove leading /)
-        clean_name = container_name.lstrip("/")
-        
-        return clean_name in ignored or container_name in ignored
+        return container_name.lstrip("/") in self._ignored_names
     
     async def check(self) -> dict[str, Any]:
         """
         Check all Docker containers.
         
+        Overlapping callers (scheduler, report, Web UI) share the check that
+        is already running instead of querying every container again.
+        
         Returns:
             Dictionary with container statuses and summary
         """
+        if self._running_check is None or self._running_check.done():
+            self._running_check = asyncio.create_task(self._check())
+        # Shielded so one caller being cancelled does not cancel the others
+        return await asyncio.shield(self._running_check)
+    
+    async def _check(self) -> dict[str, Any]:
+        """Run one full container check (see check())."""
         try:
             client = self._get_client()
         except DockerException:
@@ -99,20 +141,53 @@ class DockerMonitor(BaseMonitor):
         }
         
         try:
-            # Get all containers (including stopped)
-            containers = client.containers.list(all=True)
+            # Get all containers (including stopped). sparse=True skips the
+            # SDK's serial per-container inspect; tracked containers are
+            # inspected in _get_container_status, in parallel
+            containers = await asyncio.to_thread(
+                client.containers.list, all=True, sparse=True
+            )
             
+            tracked = []
             for container in containers:
-                name = container.name
-                
+                # Sparse attrs carry "Names" rather than "Name"
+                names = container.attrs.get("Names") or [container.id]
                 # Skip ignored containers
-                if self._is_ignored(name):
-                    logger.debug(f"Skipping ignored container: {name}")
+                if self._is_ignored(names[0]):
+                    logger.debug(f"Skipping ignored container: {names[0].lstrip('/')}")
+                    continue
+                tracked.append(container)
+            
+            # Collect statuses concurrently; each blocks on Docker API calls
+            # (stats sampling especially), so they run in worker threads
+            semaphore = asyncio.Semaphore(self.config.docker.max_stat_concurrency)
+            
+            async def collect(container) -> ContainerStatus:
+                async with semaphore:
+                    return await asyncio.to_thread(self._get_container_status, container)
+            
+            statuses = await asyncio.gather(
+                *(collect(container) for container in tracked),
+                return_exceptions=True,
+            )
+            
+            # Forget CPU samples of containers that are gone
+            current_ids = {container.id for container in tracked}
+            for samples in (self._cpu_samples, self._cgroup_cpu_samples):
+                for container_id in samples.keys() - current_ids:
+                    del samples[container_id]
+            
+            # Bookkeeping and alerts stay sequential, in container list order
+            for container, status in zip(tracked, statuses):
+                if isinstance(status, Exception):
+                    logger.error(
+                        f"Error getting status for container {container.short_id}: {status}"
+                    )
                     continue
                 
-                # Get container status
-                status = await self._get_container_status(container)
-                containers_data.append(status.__dict__)
+                name = status.name
+                
+                containers_data.append(asdict(status))
                 
                 # Update summary
                 summary["total"] += 1
@@ -143,45 +218,49 @@ class DockerMonitor(BaseMonitor):
             "summary": summary,
         }
     
-    async def _get_container_status(self, container) -> ContainerStatus:
-        """Get detailed status for a container."""
+    def _get_container_status(self, container) -> ContainerStatus:
+        """Get detailed status for a container (blocking; run in a thread)."""
+        # The sparse list entry lacks health, restart count and start time
+        container.reload()
+        
         # Basic info
         name = container.name
         status = container.status
+        attrs = container.attrs
+        state = attrs.get("State") or {}
         
         # Get health if available
         health = None
-        try:
-            health_data = container.attrs.get("State", {}).get("Health", {})
-            if health_data:
-                health = health_data.get("Status")
-        except Exception:
-            pass
+        health_data = state.get("Health")
+        if health_data:
+            health = health_data.get("Status")
         
-        # Get image info
-        try:
-            image_tags = container.image.tags
-            image = image_tags[0] if image_tags else str(container.image.id)[:12]
-        except Exception:
-            image = "unknown"
+        # Get image info from the inspect data; container.image would cost
+        # an extra image inspect request per container
+        image = (
+            (attrs.get("Config") or {}).get("Image")
+            or attrs.get("Image", "").removeprefix("sha256:")[:12]
+            or "unknown"
+        )
         
         # Get timestamps
         created = None
         started_at = None
         try:
-            created_str = container.attrs.get("Created", "")
+            created_str = attrs.get("Created", "")
             if created_str:
-                # Docker uses RFC3339 format
-                created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+                # Docker uses RFC3339 format ("Z" suffix, nanoseconds); Python
+                # 3.11+ fromisoformat accepts it as is
+                created = datetime.fromisoformat(created_str)
             
-            started_str = container.attrs.get("State", {}).get("StartedAt", "")
+            started_str = state.get("StartedAt", "")
             if started_str and not started_str.startswith("0001"):
-                started_at = datetime.fromisoformat(started_str.replace("Z", "+00:00"))
+                started_at = datetime.fromisoformat(started_str)
         except Exception as e:
             logger.debug(f"Error parsing container timestamps: {e}")
         
         # Get restart count
-        restart_count = container.attrs.get("RestartCount", 0)
+        restart_count = attrs.get("RestartCount", 0)
         
         # Get resource stats (only for running containers)
         cpu_percent = 0.0
@@ -189,29 +268,12 @@ class DockerMonitor(BaseMonitor):
         memory_limit = 0
         
         if status.lower() == "running":
-            try:
-                stats = container.stats(stream=False)
-                
-                # Calculate CPU percentage
-                cpu_delta = (
-                    stats["cpu_stats"]["cpu_usage"]["total_usage"]
-                    - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-                )
-                system_delta = (
-                    stats["cpu_stats"]["system_cpu_usage"]
-                    - stats["precpu_stats"]["system_cpu_usage"]
-                )
-                
-                if system_delta > 0:
-                    num_cpus = len(stats["cpu_stats"]["cpu_usage"].get("percpu_usage", [1]))
-                    cpu_percent = (cpu_delta / system_delta) * num_cpus * 100
-                
-                # Get memory usage
-                memory_usage = stats["memory_stats"].get("usage", 0)
-                memory_limit = stats["memory_stats"].get("limit", 0)
-                
-            except Exception as e:
-                logger.debug(f"Error getting container stats for {name}: {e}")
+            # cgroup files first (no daemon round trip), stats API otherwise
+            resources = self._read_cgroup_resources(container.id)
+            if resources is None:
+                resources = self._read_api_resources(container)
+            if resources is not None:
+                cpu_percent, memory_usage, memory_limit = resources
         
         return ContainerStatus(
             name=name,
@@ -226,6 +288,98 @@ class DockerMonitor(BaseMonitor):
             memory_limit=memory_limit,
         )
     
+    def _read_cgroup_resources(self, container_id: str) -> tuple[float, int, int] | None:
+        """
+        Read (CPU %, memory usage, memory limit) from the container's cgroup v2 files.
+        
+        CPU is averaged over the time since the previous check; without a
+        usable previous sample, over a short second sample. Returns None when
+        the files are not reachable (cgroup v1, host /sys not mounted,
+        Docker Desktop).
+        """
+        for pattern in _CGROUP_DIR_PATTERNS:
+            cgroup_dir = self._cgroup_root / pattern.format(id=container_id)
+            try:
+                cpu_stat = (cgroup_dir / "cpu.stat").read_text()
+                memory_usage = int((cgroup_dir / "memory.current").read_text())
+                memory_max = (cgroup_dir / "memory.max").read_text().strip()
+            except (OSError, ValueError):
+                continue
+            break
+        else:
+            return None
+        
+        sampled_at = time.monotonic_ns()
+        usage_usec = _cgroup_usage_usec(cpu_stat)
+        # "max" means no limit: the container can use all host memory
+        memory_limit = psutil.virtual_memory().total if memory_max == "max" else int(memory_max)
+        
+        previous = self._cgroup_cpu_samples.get(container_id)
+        # usage_usec below the last sample: container restarted, counter reset
+        if previous is None or usage_usec < previous[0]:
+            previous = (usage_usec, sampled_at)
+            time.sleep(_CPU_BASELINE_SAMPLE_SECONDS)
+            try:
+                usage_usec = _cgroup_usage_usec((cgroup_dir / "cpu.stat").read_text())
+            except (OSError, ValueError):
+                # Container stopped in between
+                return 0.0, memory_usage, memory_limit
+            sampled_at = time.monotonic_ns()
+        self._cgroup_cpu_samples[container_id] = (usage_usec, sampled_at)
+        
+        cpu_percent = 0.0
+        cpu_delta = usage_usec - previous[0]
+        wall_usec = (sampled_at - previous[1]) / 1000
+        if wall_usec > 0 and cpu_delta >= 0:
+            cpu_percent = cpu_delta / wall_usec * 100
+        
+        return cpu_percent, memory_usage, memory_limit
+    
+    def _read_api_resources(self, container) -> tuple[float, int, int] | None:
+        """Read (CPU %, memory usage, memory limit) through the Docker stats API."""
+        try:
+            previous = self._cpu_samples.get(container.id)
+            # one_shot returns immediately instead of waiting ~1s for a
+            # second sample; CPU usage is diffed against the previous check
+            stats = container.stats(stream=False, one_shot=previous is not None)
+            
+            # Usage below the last sample: container restarted, counter reset
+            if previous is not None and stats["cpu_stats"]["cpu_usage"]["total_usage"] < previous[0]:
+                previous = None
+                stats = container.stats(stream=False)
+            
+            # No usable previous sample: diff against the daemon's own
+            # earlier sample (precpu_stats) instead
+            if previous is None:
+                precpu = stats["precpu_stats"]
+                previous = (precpu["cpu_usage"]["total_usage"], precpu["system_cpu_usage"])
+            
+            # Calculate CPU percentage (average since the previous sample)
+            cpu_percent = 0.0
+            cpu_total = stats["cpu_stats"]["cpu_usage"]["total_usage"]
+            system_total = stats["cpu_stats"]["system_cpu_usage"]
+            self._cpu_samples[container.id] = (cpu_total, system_total)
+            
+            cpu_delta = cpu_total - previous[0]
+            system_delta = system_total - previous[1]
+            if system_delta > 0 and cpu_delta >= 0:
+                # Per-core scale like `docker stats` and the cgroup path;
+                # cgroup v2 hosts report online_cpus but no percpu_usage
+                num_cpus = stats["cpu_stats"].get("online_cpus") or len(
+                    stats["cpu_stats"]["cpu_usage"].get("percpu_usage") or [1]
+                )
+                cpu_percent = (cpu_delta / system_delta) * num_cpus * 100
+            
+            # Get memory usage
+            memory_usage = stats["memory_stats"].get("usage", 0)
+            memory_limit = stats["memory_stats"].get("limit", 0)
+            
+            return cpu_percent, memory_usage, memory_limit
+            
+        except Exception as e:
+            logger.debug(f"Error getting container stats for {container.name}: {e}")
+            return None
+    
     async def _check_container_issues(
         self,
         name: str,
@@ -316,7 +470,11 @@ class DockerMonitor(BaseMonitor):
     
     async def get_report_data(self) -> dict[str, Any]:
         """Get Docker data for weekly report."""
-        current = await self.check()
+        # Reuse the scheduled check if it is recent (stats sampling is slow)
+        if self.is_fresh(self.config.monitoring.docker_interval_seconds):
+            current = self.get_last_data()
+        else:
+            current = await self.check()
         
         if "error" in current:
             return {
@@ -10,14 +10,27 @@ Provides common functionality for all service clients:
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Services live on the LAN; an unreachable host should fail fast instead
+# of using up the whole request timeout while connecting
+CONNECT_TIMEOUT_SECONDS = 2
+
+# Response body parser (library responses can be several MB of JSON)
+json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class BaseServiceClient:
     """
@@ -31,6 +44,7 @@ class BaseServiceClient:
         base_url: str | None,
         api_key: str | None = None,
         timeout: int = 10,
+        session: aiohttp.ClientSession | None = None,
     ):
         """
         Initialize the service client.
@@ -39,11 +53,14 @@ class BaseServiceClient:
             base_url: Base URL of the service API
             api_key: API key for authentication
             timeout: Request timeout in seconds
+            session: Shared aiohttp session (owned and closed by the caller).
+                     If omitted, the client creates and closes its own.
         """
         self.base_url = base_url.rstrip("/") if base_url else None
         self.api_key = api_key
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
-        self._session: aiohttp.ClientSession | None = None
+        self.timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=CONNECT_TIMEOUT_SECONDS)
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
     
     @property
     def is_configured(self) -> bool:
@@ -65,13 +82,16 @@ class BaseServiceClient:
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
+        # No await between the check and the assignment, so concurrent
+        # callers on the event loop cannot both create a session.
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(timeout=self.timeout)
+            self._owns_session = True
         return self._session
     
     async def close(self) -> None:
-        """Close the aiohttp session."""
-        if self._session and not self._session.closed:
+        """Close the aiohttp session (a shared session is left to its owner)."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
             self._session = None
     
@@ -110,9 +130,10 @@ class BaseServiceClient:
                 headers=headers,
                 params=params,
                 json=json_data,
+                timeout=self.timeout,
             ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=json_loads)
                 elif response.status == 401:
                     logger.error(f"{self.name}: Unauthorized - check API key")
                     return None
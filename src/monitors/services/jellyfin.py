@@ -10,6 +10,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import aiohttp
+
 from monitors.services.base import BaseServiceClient
 
 
@@ -28,8 +30,9 @@ class JellyfinClient(BaseServiceClient):
         base_url: str | None,
         api_key: str | None = None,
         timeout: int = 10,
+        session: aiohttp.ClientSession | None = None,
     ):
-        super().__init__(base_url, api_key, timeout)
+        super().__init__(base_url, api_key, timeout, session=session)
     
     def _get_headers(self) -> dict[str, str]:
         """Jellyfin uses X-Emby-Token header (Jellyfin is fork of Emby)."""
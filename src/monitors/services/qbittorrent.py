@@ -12,7 +12,7 @@ from typing import Any
 
 import aiohttp
 
-from monitors.services.base import BaseServiceClient
+from monitors.services.base import BaseServiceClient, json_loads
 
 
 logger = logging.getLogger(__name__)
@@ -31,9 +31,14 @@ class QBittorrentClient(BaseServiceClient):
         username: str | None = None,
         password: str | None = None,
         timeout: int = 10,
+        session: aiohttp.ClientSession | None = None,
     ):
-        # qBittorrent doesn't use API key, uses session cookies
+        # qBittorrent doesn't use API key, uses session cookies. Cookies match
+        # on host only, and the other services usually share qBittorrent's
+        # IP, so the login cookie lives in a session of our own; a shared
+        # session only lends its connection pool (see _get_session).
         super().__init__(base_url, api_key=None, timeout=timeout)
+        self._shared_session = session
         self.username = username
         self.password = password
         self._authenticated = False
@@ -47,13 +52,22 @@ class QBittorrentClient(BaseServiceClient):
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get session with cookies."""
         if self._session is None or self._session.closed:
+            # Reuse the shared session's connection pool when there is one;
+            # the connector stays owned (and closed) by the shared session
+            shared = self._shared_session
+            connector = shared.connector if shared is not None and not shared.closed else None
             # Create session with cookie jar
             # unsafe=True allows cookies for IP addresses (not just domains)
             jar = aiohttp.CookieJar(unsafe=True)
             self._session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=connector is None,
                 timeout=self.timeout,
                 cookie_jar=jar,
             )
+            self._owns_session = True
+            # A new jar has no login cookie
+            self._authenticated = False
         return self._session
     
     async def _ensure_authenticated(self) -> bool:
@@ -74,7 +88,7 @@ class QBittorrentClient(BaseServiceClient):
                 "password": self.password or "",
             }
             
-            async with session.post(login_url, data=data) as response:
+            async with session.post(login_url, data=data, timeout=self.timeout) as response:
                 if response.status == 200:
                     text = await response.text()
                     if text.strip().lower() == "ok.":
@@ -114,17 +128,17 @@ class QBittorrentClient(BaseServiceClient):
                 url=url,
                 params=params,
                 json=json_data,
+                timeout=self.timeout,
             ) as response:
                 if response.status == 200:
                     content_type = response.headers.get("Content-Type", "")
                     if "application/json" in content_type:
-                        return await response.json()
+                        return await response.json(loads=json_loads)
                     else:
                         # Some endpoints return plain text
                         text = await response.text()
                         try:
-                            import json
-                            return json.loads(text)
+                            return json_loads(text)
                         except Exception:
                             return {"text": text}
                 elif response.status == 403 and not _retry:
@@ -11,6 +11,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any
 
+import aiohttp
+
 from monitors.services.base import BaseServiceClient
 
 
@@ -29,8 +31,9 @@ class SonarrClient(BaseServiceClient):
         base_url: str | None,
         api_key: str | None = None,
         timeout: int = 10,
+        session: aiohttp.ClientSession | None = None,
     ):
-        super().__init__(base_url, api_key, timeout)
+        super().__init__(base_url, api_key, timeout, session=session)
     
     def _get_headers(self) -> dict[str, str]:
         """Sonarr uses X-Api-Key header."""
@@ -75,6 +75,8 @@ class SystemMonitor(BaseMonitor):
             "disks": await self._check_disks(),
             "temperatures": await self._check_temperatures(),
         }
+        # Index for mountpoint lookups (same disk dicts as "disks")
+        data["disks_by_mount"] = {d["mountpoint"]: d for d in data["disks"]}
         
         return data
     
@@ -159,6 +161,7 @@ class SystemMonitor(BaseMonitor):
     async def _check_disks(self) -> list[dict[str, Any]]:
         """Check disk usage for all mounted partitions."""
         disks = []
+        readings = []
         disk_config = self.config.disk_monitoring
         
         # Get all disk partitions
@@ -206,14 +209,15 @@ class SystemMonitor(BaseMonitor):
                             "Total": f"{usage.total / (1024**3):.1f} GB",
                         }
                     )
-                    
-                    await self.alert_manager.process_reading(reading)
+                    readings.append(reading)
                     
             except PermissionError:
                 logger.debug(f"Permission denied for {partition.mountpoint}")
             except Exception as e:
                 logger.debug(f"Error checking disk {partition.mountpoint}: {e}")
         
+        await self.alert_manager.process_readings(readings)
+        
         return disks
 
     def _is_included_mount(self, mountpoint: str) -> bool:
@@ -272,6 +276,7 @@ class SystemMonitor(BaseMonitor):
     async def _check_temperatures(self) -> dict[str, list[dict[str, Any]]]:
         """Check temperature sensors."""
         temps = {}
+        readings = []
         
         try:
             # Get all temperature sensors
@@ -313,8 +318,7 @@ class SystemMonitor(BaseMonitor):
                             warning_threshold=self.config.thresholds.temperature.warning,
                             critical_threshold=self.config.thresholds.temperature.critical,
                         )
-                        
-                        await self.alert_manager.process_reading(reading)
+                        readings.append(reading)
                 
                 if sensor_temps:  # Only add if there are valid sensors
                     temps[name] = sensor_temps
@@ -322,12 +326,17 @@ class SystemMonitor(BaseMonitor):
         except Exception as e:
             logger.warning(f"Error reading temperatures: {e}")
         
+        await self.alert_manager.process_readings(readings)
+        
         return temps
     
     async def get_report_data(self) -> dict[str, Any]:
         """Get system data for weekly report."""
-        # Get current data
-        current = await self.check()
+        # Get current data (reuse the scheduled check if it is recent)
+        if self.is_fresh(self.config.monitoring.system_interval_seconds):
+            current = self.get_last_data()
+        else:
+            current = await self.check()
         
         # Calculate averages from history
         cpu_avg = sum(self._cpu_history) / len(self._cpu_history) if self._cpu_history else 0
@@ -341,16 +350,11 @@ class SystemMonitor(BaseMonitor):
             uptime_seconds = 0
         
         # Find main disk (user share)
-        main_disk = next(
-            (d for d in current.get("disks", []) if d["mountpoint"] == "/mnt/user"),
-            current.get("disks", [{}])[0] if current.get("disks") else {}
-        )
+        disks_by_mount = current["disks_by_mount"]
+        main_disk = disks_by_mount.get("/mnt/user") or (current["disks"][0] if current["disks"] else {})
         
         # Find cache disk
-        cache_disk = next(
-            (d for d in current.get("disks", []) if d["mountpoint"] == "/mnt/cache"),
-            None
-        )
+        cache_disk = disks_by_mount.get("/mnt/cache")
         
         # All disk info for detailed view
         excluded_mounts = self.config.disk_monitoring.exclude_mounts + ["/"]
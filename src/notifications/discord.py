@@ -7,12 +7,23 @@ Migrated from the original discord_client.py with the same functionality.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import random
+import time
+from collections import deque
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
 import aiohttp
+from yarl import URL
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .base import NotificationProvider, Alert, Report, AlertLevel
 
@@ -70,11 +81,64 @@ MAX_FIELD_VALUE_LENGTH = 1024
 MAX_EMBED_DESCRIPTION_LENGTH = 4096
 MAX_EMBED_TITLE_LENGTH = 256
 
+# Webhook rate limit (Discord allows 5 requests per 2 seconds per webhook)
+WEBHOOK_RATE_LIMIT = 5
+WEBHOOK_RATE_PERIOD_SECONDS = 2.0
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class _RateLimiter:
+    """Allow at most `rate` acquisitions per `period` seconds (sliding window, FIFO)."""
+    
+    def __init__(self, rate: int, period: float):
+        self._rate = rate
+        self._period = period
+        self._sent: deque[float] = deque()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until another request fits in the window."""
+        async with self._lock:
+            clock = asyncio.get_running_loop().time
+            now = clock()
+            while self._sent and now - self._sent[0] >= self._period:
+                self._sent.popleft()
+            if len(self._sent) >= self._rate:
+                await asyncio.sleep(self._period - (now - self._sent.popleft()))
+            self._sent.append(clock())
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_payload(payload: dict[str, Any]) -> bytes:
+    """Serialize a webhook payload to UTF-8 JSON (emoji stay unescaped)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
 
 # =============================================================================
 # Embed builders
 # =============================================================================
 
+# (epoch second, ISO string) of the last embed timestamp; embeds only need
+# second resolution, so embeds built within the same second share one string
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _embed_timestamp() -> str:
+    """Current UTC time as ISO 8601, truncated to whole seconds."""
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, cached_iso = _timestamp_cache
+    if now == cached_second:
+        return cached_iso
+    iso = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+    _timestamp_cache = (now, iso)
+    return iso
+
+
 def build_embed(
     title: str,
     description: str | None = None,
@@ -99,10 +163,13 @@ def build_embed(
         embed["color"] = color
     
     if fields:
+        # Local names: the comprehension body runs once per field
+        name_limit = MAX_FIELD_NAME_LENGTH
+        value_limit = MAX_FIELD_VALUE_LENGTH
         embed["fields"] = [
             {
-                "name": f["name"][:MAX_FIELD_NAME_LENGTH],
-                "value": str(f["value"])[:MAX_FIELD_VALUE_LENGTH],
+                "name": f["name"][:name_limit],
+                "value": str(f["value"])[:value_limit],
                 "inline": f.get("inline", True),
             }
             for f in fields[:MAX_FIELDS_PER_EMBED]
@@ -115,7 +182,7 @@ def build_embed(
         embed["thumbnail"] = {"url": thumbnail_url}
     
     if timestamp:
-        embed["timestamp"] = datetime.now(timezone.utc).isoformat()
+        embed["timestamp"] = _embed_timestamp()
     
     if author:
         embed["author"] = author
@@ -123,6 +190,38 @@ def build_embed(
     return embed
 
 
+# Fixed startup/shutdown embeds, built once (timestamp is added per send)
+_STARTUP_EMBED = build_embed(
+    title="🚀 Unraid Monitor Started",
+    description="Monitoring is now active.",
+    color=EmbedColor.SUCCESS,
+    fields=[
+        {"name": "Status", "value": "Online", "inline": True},
+        {"name": "Version", "value": VERSION, "inline": True},
+    ],
+    footer="Unraid Monitor",
+    timestamp=False,
+)
+
+_SHUTDOWN_EMBED = build_embed(
+    title="🛑 Unraid Monitor Stopped",
+    description="Monitoring has been stopped.",
+    color=EmbedColor.WARNING,
+    footer="Unraid Monitor",
+    timestamp=False,
+)
+
+
+def _stamped_copy(embed: dict[str, Any]) -> dict[str, Any]:
+    """Copy of a prebuilt embed with a current timestamp (nested containers copied too)."""
+    stamped = {**embed, "timestamp": _embed_timestamp()}
+    if "fields" in embed:
+        stamped["fields"] = [dict(f) for f in embed["fields"]]
+    if "footer" in embed:
+        stamped["footer"] = dict(embed["footer"])
+    return stamped
+
+
 # =============================================================================
 # Discord Provider
 # =============================================================================
@@ -142,6 +241,7 @@ class DiscordProvider(NotificationProvider):
         report_channel_id: str | None = None,
         timeout: int = 10,
         bot_name: str = "Unraid Monitor",
+        session: aiohttp.ClientSession | None = None,
     ):
         """
         Initialize Discord provider.
@@ -152,13 +252,18 @@ class DiscordProvider(NotificationProvider):
             report_channel_id: Optional separate channel for reports
             timeout: Request timeout in seconds
             bot_name: Display name for the webhook
+            session: Shared aiohttp session (owned and closed by the caller)
         """
         self.webhook_url = webhook_url
+        # Parsed once; aiohttp uses a URL instance as-is instead of re-parsing
+        self._webhook_url = URL(webhook_url)
         self.user_id = user_id
         self.report_channel_id = report_channel_id
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.bot_name = bot_name
-        self._session: aiohttp.ClientSession | None = None
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
+        self._limiter = _RateLimiter(WEBHOOK_RATE_LIMIT, WEBHOOK_RATE_PERIOD_SECONDS)
     
     @property
     def name(self) -> str:
@@ -169,13 +274,16 @@ class DiscordProvider(NotificationProvider):
         return bool(self.webhook_url and "discord.com/api/webhooks" in self.webhook_url)
     
     async def initialize(self) -> None:
-        """Create aiohttp session."""
+        """Create aiohttp session (unless a shared one was provided)."""
+        # No await between the check and the assignment, so concurrent
+        # callers on the event loop cannot both create a session.
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(timeout=self.timeout)
+            self._owns_session = True
     
     async def close(self) -> None:
-        """Close aiohttp session."""
-        if self._session and not self._session.closed:
+        """Close aiohttp session (a shared session is left to its owner)."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
             self._session = None
     
@@ -202,19 +310,36 @@ class DiscordProvider(NotificationProvider):
             payload["embeds"] = embeds[:MAX_EMBEDS_PER_MESSAGE]
         
         try:
+            data = _encode_payload(payload)
             session = await self._get_session()
-            async with session.post(self.webhook_url, json=payload) as response:
-                if response.status == 204:
-                    logger.debug("Discord message sent successfully")
-                    return True
-                elif response.status == 429:
-                    retry_after = response.headers.get("Retry-After", "?")
-                    logger.warning(f"Discord rate limited, retry after: {retry_after}s")
-                    return False
-                else:
-                    body = await response.text()
-                    logger.error(f"Discord error {response.status}: {body}")
-                    return False
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                # Pace requests proactively instead of waiting for a 429
+                await self._limiter.acquire()
+                async with session.post(
+                    self._webhook_url, data=data, headers=JSON_HEADERS, timeout=self.timeout
+                ) as response:
+                    if response.status == 204:
+                        logger.debug("Discord message sent successfully")
+                        return True
+                    elif response.status == 429:
+                        try:
+                            retry_after = float(response.headers.get("Retry-After", 1))
+                        except ValueError:
+                            retry_after = 1.0
+                    else:
+                        body = await response.text()
+                        logger.error(f"Discord error {response.status}: {body}")
+                        return False
+                
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    break
+                # Exponential backoff with jitter on top of Discord's hint
+                delay = retry_after * 2 ** attempt + random.uniform(0, 0.25)
+                logger.warning(f"Discord rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            
+            logger.error(f"Discord rate limited, giving up after {MAX_RATE_LIMIT_RETRIES} retries")
+            return False
         except aiohttp.ClientError as e:
             logger.error(f"Discord network error: {e}")
             return False
@@ -257,32 +382,32 @@ class DiscordProvider(NotificationProvider):
     
     async def send_report(self, report: Report) -> bool:
         """Send a report to Discord."""
-        embeds = []
+        success = True
         
         # Header
-        embeds.append(build_embed(
+        batch = [build_embed(
             title=f"📊 {report.title}",
             description=f"Generated on {report.generated_at.strftime('%Y-%m-%d %H:%M')}",
             color=EmbedColor.PURPLE,
-        ))
+        )]
         
-        # Sections
+        # Sections, sent as soon as a message's worth of embeds is built
         for section in report.sections:
             color = COLOR_MAP.get(section.color, EmbedColor.INFO)
-            embeds.append(build_embed(
+            batch.append(build_embed(
                 title=section.title,
                 description=section.description,
                 color=color,
                 fields=section.fields,
                 timestamp=False,
             ))
+            if len(batch) == MAX_EMBEDS_PER_MESSAGE:
+                if not await self._send_webhook(embeds=batch):
+                    success = False
+                batch = []
         
-        # Send in batches
-        success = True
-        for i in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
-            batch = embeds[i:i + MAX_EMBEDS_PER_MESSAGE]
-            if not await self._send_webhook(embeds=batch):
-                success = False
+        if batch and not await self._send_webhook(embeds=batch):
+            success = False
         
         return success
     
@@ -298,26 +423,12 @@ class DiscordProvider(NotificationProvider):
     
     async def send_startup(self) -> bool:
         """Send startup notification."""
-        embed = build_embed(
-            title="🚀 Unraid Monitor Started",
-            description="Monitoring is now active.",
-            color=EmbedColor.SUCCESS,
-            fields=[
-                {"name": "Status", "value": "Online", "inline": True},
-                {"name": "Version", "value": VERSION, "inline": True},
-            ],
-            footer="Unraid Monitor",
-        )
+        embed = _stamped_copy(_STARTUP_EMBED)
         return await self._send_webhook(embeds=[embed])
     
     async def send_shutdown(self) -> bool:
         """Send shutdown notification."""
-        embed = build_embed(
-            title="🛑 Unraid Monitor Stopped",
-            description="Monitoring has been stopped.",
-            color=EmbedColor.WARNING,
-            footer="Unraid Monitor",
-        )
+        embed = _stamped_copy(_SHUTDOWN_EMBED)
         return await self._send_webhook(embeds=[embed])
     
     # =========================================================================
@@ -7,14 +7,17 @@ to format data consistently across the application.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
 def format_bytes(bytes_value: int | float) -> str:
     """Format bytes to human readable string."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(bytes_value) < 1024:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024
-    return f"{bytes_value:.1f} PB"
+    # Unit index = number of whole 1024 (2**10) steps, read off the bit length
+    idx = min(max((int(abs(bytes_value)).bit_length() - 1) // 10, 0), 5)
+    return f"{bytes_value / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}"
 
 
 def format_percentage(value: float) -> str:
@@ -29,19 +32,18 @@ def format_temperature(celsius: float) -> str:
 
 def format_uptime(seconds: float) -> str:
     """Format uptime in human readable format."""
-    days = int(seconds // 86400)
-    hours = int((seconds % 86400) // 3600)
-    minutes = int((seconds % 3600) // 60)
+    minutes, _ = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
     
-    parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0 or not parts:
-        parts.append(f"{minutes}m")
-    
-    return " ".join(parts)
+    # Zero units are omitted; minutes are always shown when nothing else is
+    if days:
+        if hours:
+            return f"{days}d {hours}h {minutes}m" if minutes else f"{days}d {hours}h"
+        return f"{days}d {minutes}m" if minutes else f"{days}d"
+    if hours:
+        return f"{hours}h {minutes}m" if minutes else f"{hours}h"
+    return f"{minutes}m"
 
 
 def create_progress_bar(
@@ -65,14 +67,19 @@ def create_progress_bar(
         String like "████████░░ 80%"
     """
     percent = max(0, min(100, percent))
-    filled = int(length * percent / 100)
-    bar = filled_char * filled + empty_char * (length - filled)
+    bar = _build_bar(filled_char, empty_char, int(length * percent / 100), length)
     
     if show_percent:
         return f"{bar} {percent:.0f}%"
     return bar
 
 
+@lru_cache(maxsize=256)
+def _build_bar(filled_char: str, empty_char: str, filled: int, length: int) -> str:
+    """Bar string for a given fill; only a handful of distinct bars ever exist."""
+    return filled_char * filled + empty_char * (length - filled)
+
+
 def create_colored_progress_bar(
     percent: float,
     length: int = 10,
@@ -83,7 +90,6 @@ def create_colored_progress_bar(
     Uses different emoji based on percentage level.
     """
     percent = max(0, min(100, percent))
-    filled = int(length * percent / 100)
     
     if percent >= 90:
         filled_char = "🟥"
@@ -94,8 +100,7 @@ def create_colored_progress_bar(
     else:
         filled_char = "🟩"
     
-    empty_char = "⬜"
-    bar = filled_char * filled + empty_char * (length - filled)
+    bar = _build_bar(filled_char, "⬜", int(length * percent / 100), length)
     
     if show_percent:
         return f"{bar} {percent:.0f}%"
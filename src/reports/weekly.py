@@ -7,12 +7,13 @@ to create a comprehensive weekly digest for Discord.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime
+import time
 from typing import TYPE_CHECKING, Any
 
-from discord_client import (
-    DiscordClient,
+from notifications import (
+    DiscordProvider,
     EmbedColor,
     build_embed,
     format_bytes,
@@ -38,6 +39,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Longest a single report section may spend collecting its data
+_SECTION_TIMEOUT_SECONDS = 60
+
 
 class WeeklyReportGenerator:
     """
@@ -53,7 +57,7 @@ class WeeklyReportGenerator:
     def __init__(
         self,
         config: "Config",
-        discord: DiscordClient,
+        discord: DiscordProvider,
         alert_manager: "AlertManager",
         system_monitor: "SystemMonitor | None" = None,
         docker_monitor: "DockerMonitor | None" = None,
@@ -93,40 +97,42 @@ class WeeklyReportGenerator:
             # Header embed
             embeds.append(self._build_header_embed())
             
+            # Data-backed sections are collected concurrently, each bounded
+            # by a deadline; gather keeps them in report order
+            builders = []
+            
             # System overview
             if self.system_monitor:
-                system_embed = await self._build_system_embed()
-                if system_embed:
-                    embeds.append(system_embed)
+                builders.append(self._build_system_embed())
             
             # Docker status
             if self.docker_monitor:
-                docker_embed = await self._build_docker_embed()
-                if docker_embed:
-                    embeds.append(docker_embed)
+                builders.append(self._build_docker_embed())
             
             # Media stack (Radarr + Sonarr)
-            media_embed = await self._build_media_embed()
-            if media_embed:
-                embeds.append(media_embed)
+            builders.append(self._build_media_embed())
             
             # Immich
             if self.immich and self.immich.is_configured:
-                immich_embed = await self._build_immich_embed()
-                if immich_embed:
-                    embeds.append(immich_embed)
+                builders.append(self._build_immich_embed())
             
             # Jellyfin
             if self.jellyfin and self.jellyfin.is_configured:
-                jellyfin_embed = await self._build_jellyfin_embed()
-                if jellyfin_embed:
-                    embeds.append(jellyfin_embed)
+                builders.append(self._build_jellyfin_embed())
             
             # Downloads (qBittorrent)
             if self.qbittorrent and self.qbittorrent.is_configured:
-                downloads_embed = await self._build_downloads_embed()
-                if downloads_embed:
-                    embeds.append(downloads_embed)
+                builders.append(self._build_downloads_embed())
+            
+            sections = await asyncio.gather(
+                *(asyncio.wait_for(builder, _SECTION_TIMEOUT_SECONDS) for builder in builders),
+                return_exceptions=True,
+            )
+            for section in sections:
+                if isinstance(section, Exception):
+                    logger.error(f"Skipping report section: {section!r}")
+                elif section:
+                    embeds.append(section)
             
             # Alert summary
             alerts_embed = self._build_alerts_embed()
@@ -149,11 +155,9 @@ class WeeklyReportGenerator:
     
     def _build_header_embed(self) -> dict[str, Any]:
         """Build the report header embed."""
-        now = datetime.now()
-        
         return build_embed(
             title="📊 Weekly Server Report",
-            description=f"Report for week ending {now.strftime('%B %d, %Y')}",
+            description=f"Report for week ending {time.strftime('%B %d, %Y')}",
             color=EmbedColor.PURPLE,
             footer="Unraid Monitor - Weekly Digest",
         )
@@ -19,14 +19,14 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import load_config, setup_logging
-from discord_client import DiscordClient, build_embed, EmbedColor
+from notifications import DiscordProvider, build_embed, EmbedColor
 
 
 async def test_webhook(config):
     """Test basic webhook connectivity."""
     print("🔗 Testing Discord webhook...")
     
-    discord = DiscordClient(
+    discord = DiscordProvider(
         webhook_url=config.discord_webhook_url,
         user_id=config.discord_user_id or None,
     )
@@ -56,7 +56,7 @@ async def test_alert_warning(config):
     """Test warning alert (no ping)."""
     print("⚠️ Testing WARNING alert...")
     
-    discord = DiscordClient(
+    discord = DiscordProvider(
         webhook_url=config.discord_webhook_url,
         user_id=config.discord_user_id or None,
     )
@@ -83,7 +83,7 @@ async def test_alert_critical(config):
     """Test critical alert (with ping)."""
     print("🚨 Testing CRITICAL alert (you should be pinged)...")
     
-    discord = DiscordClient(
+    discord = DiscordProvider(
         webhook_url=config.discord_webhook_url,
         user_id=config.discord_user_id or None,
     )
@@ -114,7 +114,7 @@ async def test_alert_recovery(config):
     """Test recovery alert."""
     print("✅ Testing RECOVERY alert...")
     
-    discord = DiscordClient(
+    discord = DiscordProvider(
         webhook_url=config.discord_webhook_url,
         user_id=config.discord_user_id or None,
     )
@@ -145,7 +145,7 @@ async def test_system_metrics(config):
         from monitors.system import SystemMonitor
         from alerts.manager import AlertManager
         
-        discord = DiscordClient(
+        discord = DiscordProvider(
             webhook_url=config.discord_webhook_url,
             user_id=config.discord_user_id or None,
         )
@@ -195,7 +195,7 @@ async def test_docker(config):
         from monitors.docker_monitor import DockerMonitor
         from alerts.manager import AlertManager
         
-        discord = DiscordClient(
+        discord = DiscordProvider(
             webhook_url=config.discord_webhook_url,
             user_id=config.discord_user_id or None,
         )
@@ -369,7 +369,7 @@ async def test_weekly_report(config):
         from monitors.services.qbittorrent import QBittorrentClient
         from alerts.manager import AlertManager
         
-        discord = DiscordClient(
+        discord = DiscordProvider(
             webhook_url=config.discord_webhook_url,
             user_id=config.discord_user_id or None,
         )
@@ -14,13 +14,19 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI, HTTPException, Request, Depends
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from passlib.context import CryptContext
+import bcrypt
 import uvicorn
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from database import Database
     from notifications import NotificationProvider
@@ -33,9 +39,6 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-# Password hashing context (bcrypt)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # HTTP Basic Auth
 security = HTTPBasic(auto_error=False)
 
@@ -44,6 +47,16 @@ TEMPLATES_DIR = Path(__file__).parent / "templates"
 STATIC_DIR = Path(__file__).parent / "static"
 
 
+def _verify_password(password: str, password_hash: str) -> bool:
+    """Check a plain-text password against a bcrypt hash."""
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+    except ValueError:
+        # Malformed hash (e.g. WEB_PASSWORD set to plain text)
+        logger.error("WEB_PASSWORD is not a valid bcrypt hash")
+        return False
+
+
 class WebUI:
     """
     Web UI manager for Unraid Monitor.
@@ -133,6 +146,8 @@ def create_app(web_ui: WebUI = None) -> FastAPI:
         description="Web UI for Unraid server monitoring",
         version=__version__,
         lifespan=lifespan,
+        # orjson renders the polled stats dicts straight to bytes
+        default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
     )
     
     # Store web_ui reference
@@ -173,7 +188,7 @@ def create_app(web_ui: WebUI = None) -> FastAPI:
             )
 
         # Verify password hash
-        is_valid = pwd_context.verify(credentials.password, ui.password)
+        is_valid = _verify_password(credentials.password, ui.password)
         
         if not is_valid:
             raise HTTPException(
@@ -353,7 +368,8 @@ def create_app(web_ui: WebUI = None) -> FastAPI:
         authenticated: bool = Depends(verify_auth)
     ) -> list:
         """Get recent alerts."""
-        alerts = ui.db.get_recent_alerts(limit)
+        # One worker thread runs the whole query (connections are per-thread)
+        alerts = await run_in_threadpool(ui.db.get_recent_alerts, limit)
         return [a.to_dict() for a in alerts]
     
     @app.get("/api/alerts/stats")